@@ -22,6 +22,9 @@ Functions:
 import re
 import toml
 
+# Matches markdown list entries of the form "* [Name](link)", one per line
+CONTRIBUTOR_PATTERN = re.compile(r"^\s*\*\s\[([^\]]+)\]\(.*\)", re.MULTILINE)
+
 
 def parse_contributors(file_path):
     """
@@ -33,14 +36,9 @@ def parse_contributors(file_path):
     Returns:
         list: A list of dictionaries with author names.
     """
-    contributors = []
     with open(file_path, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-        for line in lines:
-            if match := re.match(r"\*\s\[(.*)\]\(.*\)", line.strip()):
-                name = match.group(1)
-                contributors.append({"name": name})
-    return contributors
+        text = file.read()
+    return [{"name": match.group(1)} for match in CONTRIBUTOR_PATTERN.finditer(text)]
 
 
 def update_pyproject_toml(pyproject_path, contributors):
@@ -22,10 +22,14 @@ Classes:
 Functions:
     `_fetch_user_resources`: Fetches resources for a specific user from Firestore based on
         the given collection and subcollection names, optionally filtering by LOINC codes.
+    `_filter_by_index`: Restricts a Firestore query to a date range on a registered index.
     `_process_loinc_codes`: Filters documents based on LOINC codes from a Firestore collection
         reference, converting matching documents into FHIR Resource instances.
     `_process_all_documents`: Fetches and processes all documents from a Firestore collection
         reference for a specific user, converting each document to a FHIR Resource instance.
+    `_loinc_code_filters`: Builds the Firestore `code.coding` filters for a list of LOINC codes.
+    `_create_resources`: Converts one user's Firestore documents into FHIR Resource instances
+        using the creator matching their resource type.
     `create_resources`: Converts Firestore documents into FHIR Resources instances, associating
         each with the corresponding user's Firestore document ID.
     `get_code_mappings`: Retrieves mappings for a given LOINC code or custom code, supporting the
@@ -33,7 +37,8 @@ Functions:
 """
 
 # Standard library imports
-import json
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 import os
 from typing import Any, Optional
 
@@ -47,6 +52,7 @@ from google.cloud.firestore import (
     DocumentSnapshot,
 )
 from google.cloud.firestore_v1.base_query import FieldFilter
+from google.cloud.firestore_v1.field_path import FieldPath
 from fhir.resources.R4B.resource import Resource
 from fhir.resources.R4B.observation import Observation
 from fhir.resources.R4B.reference import Reference
@@ -66,6 +72,10 @@ LOCAL_HOST_URL = "localhost:8080"
 GCLOUD_PROJECT_STRING = "GCLOUD_PROJECT"
 FIREBASE_PROJECT_ID_PARAM_STRING = "projectId"
 ECG_RECORDING_LOINC_CODE = "131328"
+ARRAY_CONTAINS_ANY_LIMIT = 30
+
+# The code mappings are static, so a single processor serves every lookup
+_CODE_PROCESSOR = CodeProcessor()
 
 
 class FirebaseFHIRAccess:  # pylint: disable=unused-variable
@@ -84,6 +94,7 @@ class FirebaseFHIRAccess:  # pylint: disable=unused-variable
     """
 
     DEFAULT_TIMEOUT = 300
+    DEFAULT_MAX_WORKERS = 20
 
     def __init__(
         self,
@@ -144,16 +155,22 @@ class FirebaseFHIRAccess:  # pylint: disable=unused-variable
                 )
                 self.db = firestore.client()
 
-    def fetch_data(
+    def fetch_data(  # pylint: disable=too-many-positional-arguments, too-many-arguments
         self,
         collection_name: str,
         subcollection_name: str,
         loinc_codes: list[str] | None = None,
+        index_name: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> list[Resource]:
         """
         Retrieves FHIR Observation data for specified LOINC codes from Firestore.
         Data is fetched from the given collection and subcollection, optionally
-        filtered by the provided LOINC codes.
+        filtered by the provided LOINC codes. If a date range is given, it is applied
+        to each user's subcollection query in Firestore, so documents outside the range
+        are never downloaded.
 
         Parameters:
             collection_name (str): The name of the Firestore collection.
@@ -162,6 +179,11 @@ class FirebaseFHIRAccess:  # pylint: disable=unused-variable
                 Defaults to "HealthKit".
             loinc_codes (list[str] | None): Optional list of LOINC codes to filter
                 resources. If None, all resources in the subcollection are fetched.
+            index_name (str | None): The name of the Firebase index that has a registered filter
+            start_date (str | None): The start date for Firestore query index filter
+            end_date (str | None): The end date for Firestore query index filter
+            max_workers (int): The maximum number of users whose subcollections are
+                queried concurrently. Defaults to 20.
 
         Returns:
             list[Resource]: A list of FHIR resources instances matching the query criteria.
@@ -171,22 +193,33 @@ class FirebaseFHIRAccess:  # pylint: disable=unused-variable
             print("Reinitialize the Firebase app.")
             return None
 
-        if (
-            loinc_codes is not None
-            and loinc_codes.count(ECG_RECORDING_LOINC_CODE) > 0
-            and len(loinc_codes) > 1
-        ):
-            print("HealthKit quantity types and ECG recordings cannot be downloaded ")
-            print("simultaneously. Please review and adjust your selection to include ")
-            print("only the necessary LOINC codes.")
+        if _mixes_ecg_with_other_codes(loinc_codes):
             return None
         resources = []
-        users = self.db.collection(collection_name).stream(timeout=self.timeout)
-        for user in users:
-            user_resources = self._fetch_user_resources(
-                user, collection_name, subcollection_name, loinc_codes
-            )
-            resources.extend(user_resources)
+        # Only the user document IDs are needed, so project the users query onto the
+        # document name instead of downloading every user's fields.
+        users = (
+            self.db.collection(collection_name)
+            .select([FieldPath.document_id()])
+            .stream(timeout=self.timeout)
+        )
+        # Each user's subcollection query is an independent network round trip, so the
+        # queries are issued concurrently on the shared client. `map` reads the whole users
+        # stream and submits one fetch per user before it yields any result; the fetches
+        # start as they are submitted, and the results come back in the order the users
+        # were streamed.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for user_resources in executor.map(
+                lambda user: self._fetch_user_resources(
+                    user,
+                    collection_name,
+                    subcollection_name,
+                    loinc_codes,
+                    (index_name, start_date, end_date),
+                ),
+                users,
+            ):
+                resources.extend(user_resources)
         return resources
 
     def fetch_data_path(  # pylint: disable=too-many-positional-arguments, too-many-arguments
@@ -196,6 +229,7 @@ class FirebaseFHIRAccess:  # pylint: disable=unused-variable
         index_name: str | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
+        page_size: int | None = None,
     ) -> list[Resource]:
         """
         Retrieves FHIR Observation data for specified LOINC codes from Firestore.
@@ -209,38 +243,104 @@ class FirebaseFHIRAccess:  # pylint: disable=unused-variable
             index_name (str | None): The name of the Firebase index that has a registered filter
             start_date (str | None): The start date for Firestore query index filter
             end_date (str | None): The end date for Firestore query index filter
+            page_size (int | None): Optional number of documents to request per query. If
+                given, the collection is read in pages using query cursors instead of a
+                single long-running stream, and each page is converted before the next one
+                is requested.
 
         Returns:
             list[Resource]: A list of FHIR resources instances matching the query criteria.
+
+        Raises:
+            ValueError: If `page_size` is given but is not a positive number.
         """
+        if page_size is not None and page_size <= 0:
+            raise ValueError(f"page_size must be a positive integer, got {page_size}")
 
         if self.db is None:
             print("Reinitialize the Firebase app.")
             return None
 
-        if (
-            loinc_codes is not None
-            and loinc_codes.count(ECG_RECORDING_LOINC_CODE) > 0
-            and len(loinc_codes) > 1
-        ):
-            print("HealthKit quantity types and ECG recordings cannot be downloaded ")
-            print("simultaneously. Please review and adjust your selection to include ")
-            print("only the necessary LOINC codes.")
+        if _mixes_ecg_with_other_codes(loinc_codes):
             return None
 
-        path_ref = self.db.collection(full_path)
+        path_ref = _filter_by_index(
+            self.db.collection(full_path), index_name, start_date, end_date
+        )
         resources = []
-        if start_date:
-            path_ref = path_ref.where(index_name, ">=", start_date)
-        if end_date:
-            path_ref = path_ref.where(index_name, "<=", end_date)
         if loinc_codes:
             resources.extend(
-                _process_loinc_codes(path_ref, None, loinc_codes, self.timeout)
+                _process_loinc_codes(
+                    path_ref, None, loinc_codes, self.timeout, page_size
+                )
             )
         else:
-            resources.extend(_process_all_documents(path_ref, None, self.timeout))
+            resources.extend(
+                _process_all_documents(path_ref, None, self.timeout, page_size)
+            )
+
+        return resources
+
+    def fetch_data_collection_group(  # pylint: disable=too-many-positional-arguments, too-many-arguments
+        self,
+        subcollection_name: str,
+        loinc_codes: list[str] | None = None,
+        index_name: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> list[Resource]:
+        """
+        Retrieves FHIR data for specified LOINC codes from every subcollection with the given
+        name using Firestore collection group queries. Unlike `fetch_data`, which streams the
+        users and then queries each user's subcollection, this issues a single query for all
+        requested LOINC codes, so the number of round-trips does not grow with the number of
+        users. The user of each document is taken from the parent of its
+        subcollection.
 
+        Note that a collection group query matches subcollections of that name at any depth, and
+        Firestore requires a collection group index on `code.coding` for the LOINC code filter.
+
+        Parameters:
+            subcollection_name (str): The name of the Firestore subcollection, e.g. "HealthKit".
+            loinc_codes (list[str] | None): Optional list of LOINC codes to filter
+                resources. If None, all resources in the subcollections are fetched.
+            index_name (str | None): The name of the Firebase index that has a registered filter
+            start_date (str | None): The start date for Firestore query index filter
+            end_date (str | None): The end date for Firestore query index filter
+
+        Returns:
+            list[Resource]: A list of FHIR resources instances matching the query criteria.
+        """
+
+        if self.db is None:
+            print("Reinitialize the Firebase app.")
+            return None
+
+        if _mixes_ecg_with_other_codes(loinc_codes):
+            return None
+
+        query = _filter_by_index(
+            self.db.collection_group(subcollection_name),
+            index_name,
+            start_date,
+            end_date,
+        )
+        queries = (
+            [
+                query.where(filter=code_filter)
+                for code_filter in _loinc_code_filters(loinc_codes)
+            ]
+            if loinc_codes
+            else [query]
+        )
+
+        resources = []
+        for code_query in queries:
+            docs_by_user = {}
+            for doc in code_query.stream(timeout=self.timeout):
+                docs_by_user.setdefault(doc.reference.parent.parent, []).append(doc)
+            for user, fhir_docs in docs_by_user.items():
+                resources.extend(_create_resources(fhir_docs, user))
         return resources
 
     def _fetch_user_resources(
@@ -249,6 +349,7 @@ class FirebaseFHIRAccess:  # pylint: disable=unused-variable
         collection_name: str,
         subcollection_name: str,
         loinc_codes: list[str] | None,
+        date_filter: tuple[str | None, str | None, str | None] = (None, None, None),
     ) -> list[Resource]:
         """
         Private method to fetch FHIR Observation resources for a specific user,
@@ -260,16 +361,19 @@ class FirebaseFHIRAccess:  # pylint: disable=unused-variable
             collection_name (str): Name of the Firestore collection.
             subcollection_name (str): Name of the Firestore subcollection.
             loinc_codes (list[str] | None): Optional list of LOINC codes to filter observations.
+            date_filter (tuple): The index name, start date, and end date of an optional
+                Firestore index filter, as accepted by `_filter_by_index`.
 
         Returns:
             list[Resource]: List of FHIR resources corresponding to the user and
                                 optional LOINC codes filter.
         """
         resources = []
-        query = (
+        query = _filter_by_index(
             self.db.collection(collection_name)
             .document(user.id)
-            .collection(subcollection_name)
+            .collection(subcollection_name),
+            *date_filter,
         )
         if loinc_codes:
             resources.extend(
@@ -280,11 +384,62 @@ class FirebaseFHIRAccess:  # pylint: disable=unused-variable
         return resources
 
 
+def _mixes_ecg_with_other_codes(loinc_codes: list[str] | None) -> bool:
+    """
+    Checks whether ECG recordings are requested together with other codes, which cannot be
+    downloaded in the same request, and explains the problem to the user if so.
+
+    Parameters:
+        loinc_codes (list[str] | None): The requested LOINC codes or custom codes.
+
+    Returns:
+        bool: True if the selection mixes ECG recordings with other codes, False otherwise.
+    """
+    if (
+        not loinc_codes
+        or ECG_RECORDING_LOINC_CODE not in loinc_codes
+        or len(set(loinc_codes)) == 1
+    ):
+        return False
+
+    print("HealthKit quantity types and ECG recordings cannot be downloaded ")
+    print("simultaneously. Please review and adjust your selection to include ")
+    print("only the necessary LOINC codes.")
+    return True
+
+
+def _filter_by_index(
+    query: CollectionReference,
+    index_name: str | None,
+    start_date: str | None,
+    end_date: str | None,
+) -> CollectionReference:
+    """
+    Restricts a Firestore query to documents whose indexed field lies within a date range,
+    so the filtering happens on the server rather than after download.
+
+    Parameters:
+        query (CollectionReference): The Firestore collection reference or query to filter.
+        index_name (str | None): The name of the Firebase index that has a registered filter.
+        start_date (str | None): The start date for the index filter. Skipped if None.
+        end_date (str | None): The end date for the index filter. Skipped if None.
+
+    Returns:
+        CollectionReference: The query with the requested range filters applied.
+    """
+    if start_date:
+        query = query.where(index_name, ">=", start_date)
+    if end_date:
+        query = query.where(index_name, "<=", end_date)
+    return query
+
+
 def _process_loinc_codes(
     query: CollectionReference,
     user: DocumentReference,
     loinc_codes: list[str],
     timeout: float | None = None,
+    page_size: int | None = None,
 ) -> list[Resource]:
     """
     Filters documents based on LOINC codes from a Firestore collection reference. This function
@@ -295,42 +450,16 @@ def _process_loinc_codes(
         user (DocumentReference): Firestore reference to the user document.
         loinc_codes (list[str]): List of LOINC codes to filter documents.
         timeout (float | None): Optional timeout in seconds for Firestore stream operations.
+        page_size (int | None): Optional number of documents to request per query page.
 
     Returns:
         list[Resource]: A list of FHIR resources that match the specified LOINC codes.
     """
 
     resources = []
-    for code in loinc_codes:
-        display_str, code_str, system_str = get_code_mappings(code)
-        fhir_docs = list(
-            query.where(
-                filter=FieldFilter(
-                    "code.coding",
-                    "array_contains",
-                    {
-                        KeyNames.DISPLAY.value: display_str,
-                        KeyNames.SYSTEM.value: system_str,
-                        KeyNames.CODE.value: code_str,
-                    },
-                )
-            ).stream(timeout=timeout)
-        )
-
-        if not fhir_docs:
-            continue
-
-        first_doc_dict = fhir_docs[0].to_dict()
-        resource_type = first_doc_dict[KeyNames.RESOURCE_TYPE.value]
-
-        if resource_type == FHIRResourceType.OBSERVATION.value:
-            creator = ObservationCreator()
-            resources.extend(creator.create_resources(fhir_docs, user))
-        elif resource_type == FHIRResourceType.QUESTIONNAIRE_RESPONSE.value:
-            creator = QuestionnaireResponseCreator()
-            resources.extend(creator.create_resources(fhir_docs, user))
-        else:
-            raise ValueError(f"Unsupported resource type: {resource_type}")
+    for code_filter in _loinc_code_filters(loinc_codes):
+        for page in _read_pages(query.where(filter=code_filter), timeout, page_size):
+            resources.extend(_create_resources(page, user))
 
     return resources
 
@@ -339,6 +468,7 @@ def _process_all_documents(
     query: CollectionReference,
     user: DocumentReference,
     timeout: float | None = None,
+    page_size: int | None = None,
 ) -> list[Resource]:
     """
     Fetches and processes all documents from a Firestore collection reference for a specific user,
@@ -348,28 +478,117 @@ def _process_all_documents(
         query (CollectionReference): Firestore query object for a user's subcollection.
         user (DocumentReference): Firestore reference to the user document.
         timeout (float | None): Optional timeout in seconds for Firestore stream operations.
+        page_size (int | None): Optional number of documents to request per query page.
 
     Returns:
         list[Resource]: List of FHIR resources for all documents in the user's subcollection.
     """
     resources = []
+    for page in _read_pages(query, timeout, page_size):
+        resources.extend(_create_resources(page, user))
+
+    return resources
+
+
+def _read_pages(
+    query: CollectionReference,
+    timeout: float | None = None,
+    page_size: int | None = None,
+) -> Iterator[list[DocumentSnapshot]]:
+    """
+    Reads the documents matching a Firestore query one page at a time, starting each page
+    after the last document of the previous one. Every page is read to completion before it
+    is yielded, so each stream timeout only covers the reads of its page and not the parsing
+    done by the caller, and the caller holds at most one page of raw snapshots at a time.
+    Without a page size, all matching documents are read in a single stream and form one page.
+
+    Parameters:
+        query (CollectionReference): The Firestore collection reference or query to read.
+        timeout (float | None): Optional timeout in seconds for each Firestore stream operation.
+        page_size (int | None): Optional number of documents to request per query page.
+
+    Yields:
+        list[DocumentSnapshot]: The matching Firestore document snapshots of one page, in
+            query order.
+    """
+    if page_size is None:
+        yield list(query.stream(timeout=timeout))
+        return
+
+    last_doc = None
+    while True:  # pylint: disable=while-used
+        page_query = query.limit(page_size)
+        if last_doc is not None:
+            page_query = page_query.start_after(last_doc)
+        page = list(page_query.stream(timeout=timeout))
+        yield page
+        if len(page) < page_size:
+            return
+        last_doc = page[-1]
+
+
+def _loinc_code_filters(loinc_codes: list[str]) -> list[FieldFilter]:
+    """
+    Builds the Firestore filters matching documents whose `code.coding` array contains the
+    coding registered for any of the given LOINC codes or custom codes. The codes are combined
+    into `array_contains_any` filters, so all of them are fetched in a single query, split only
+    where Firestore's limit on the number of disjunctions per filter would be exceeded.
+
+    Parameters:
+        loinc_codes (list[str]): The LOINC codes or custom codes to filter by.
+
+    Returns:
+        list[FieldFilter]: The `array_contains_any` filters on `code.coding`.
+    """
+    codings = []
+    # Duplicate codes would only repeat disjunctions in the filter, so each is sent once
+    for code in dict.fromkeys(loinc_codes):
+        display_str, code_str, system_str = get_code_mappings(code)
+        codings.append(
+            {
+                KeyNames.DISPLAY.value: display_str,
+                KeyNames.SYSTEM.value: system_str,
+                KeyNames.CODE.value: code_str,
+            }
+        )
+    return [
+        FieldFilter(
+            "code.coding",
+            "array_contains_any",
+            codings[start : start + ARRAY_CONTAINS_ANY_LIMIT],
+        )
+        for start in range(0, len(codings), ARRAY_CONTAINS_ANY_LIMIT)
+    ]
 
-    if not (fhir_docs := list(query.stream(timeout=timeout))):
-        return resources
+
+def _create_resources(
+    fhir_docs: list[DocumentSnapshot], user: DocumentReference
+) -> list[Resource]:
+    """
+    Converts Firestore documents belonging to one user into FHIR Resource instances, choosing
+    the resource creator from the resource type of the first document.
+
+    Parameters:
+        fhir_docs (list[DocumentSnapshot]): Firestore document snapshots of a single user.
+        user (DocumentReference): Firestore reference to the user document.
+
+    Returns:
+        list[Resource]: List of FHIR resources created from the documents.
+    """
+    if not fhir_docs:
+        return []
 
     first_doc_dict = fhir_docs[0].to_dict()
     resource_type = first_doc_dict[KeyNames.RESOURCE_TYPE.value]
 
     if resource_type == FHIRResourceType.OBSERVATION.value:
         creator = ObservationCreator()
-        resources = creator.create_resources(fhir_docs, user)
     elif resource_type == FHIRResourceType.QUESTIONNAIRE_RESPONSE.value:
         creator = QuestionnaireResponseCreator()
-        resources = creator.create_resources(fhir_docs, user)
     else:
         raise ValueError(f"Unsupported resource type: {resource_type}")
 
-    return resources
+    return creator.create_resources(fhir_docs, user)
 
 
 @dataclass
@@ -380,7 +599,7 @@ class ResourceCreator:
         self.resource_type = resource_type
 
     def create_resources(
-        self, fhir_docs: list[DocumentSnapshot], user: DocumentReference
+        self, fhir_docs: Iterable[DocumentSnapshot], user: DocumentReference
     ) -> list[Any]:
         raise NotImplementedError("Subclasses should implement this method.")
 
@@ -409,15 +628,15 @@ class ObservationCreator(ResourceCreator):
         super().__init__(FHIRResourceType.OBSERVATION)
 
     def create_resources(
-        self, fhir_docs: list[DocumentSnapshot], user: DocumentReference
+        self, fhir_docs: Iterable[DocumentSnapshot], user: DocumentReference
     ) -> list[Observation]:
         """
         Converts Firestore documents into FHIR Observation instances, setting the subject reference
         to the user's Firestore document ID.
 
         Parameters:
-            fhir_docs (list[DocumentSnapshot]): Iterable of Firestore document snapshots containing
-                FHIR observation data.
+            fhir_docs (Iterable[DocumentSnapshot]): Iterable of Firestore document snapshots
+                containing FHIR observation data.
             user (DocumentReference): Firestore reference to the user document.
 
         Returns:
@@ -433,21 +652,14 @@ class ObservationCreator(ResourceCreator):
             doc_dict.pop("physician", None)
             doc_dict.pop("tracingQuality", None)
 
-            resource_str = json.dumps(doc_dict)
-            resource_obj = Observation.parse_raw(resource_str)
+            resource_obj = Observation.parse_obj(doc_dict)
             if user:
                 resource_obj.subject = Reference(id=user.id)
 
-            # Special handling for ECG data
-            if (
-                len(resource_obj.code.coding) > 1
-                and hasattr(
-                    resource_obj.code.coding[1],  # pylint: disable=no-member
-                    KeyNames.CODE.value,
-                )
-                and resource_obj.code.coding[1].code  # pylint: disable=no-member
-                == ECG_RECORDING_LOINC_CODE
-            ):
+            # Special handling for ECG data. Coding is a pydantic model, so its `code` field
+            # always exists and only its value needs to be compared.
+            codings = resource_obj.code.coding  # pylint: disable=no-member
+            if len(codings) > 1 and codings[1].code == ECG_RECORDING_LOINC_CODE:
                 ecg_resource_obj = ECGObservation(resource_obj)
                 resources.append(ecg_resource_obj)
             else:
@@ -480,15 +692,15 @@ class QuestionnaireResponseCreator(ResourceCreator):
         super().__init__(FHIRResourceType.QUESTIONNAIRE_RESPONSE)
 
     def create_resources(
-        self, fhir_docs: list[DocumentSnapshot], user: DocumentReference
+        self, fhir_docs: Iterable[DocumentSnapshot], user: DocumentReference
     ) -> list[QuestionnaireResponse]:
         """
         Converts Firestore documents into FHIR QuestionnaireResponse instances, setting the
         subject reference to the user's Firestore document ID.
 
         Parameters:
-            fhir_docs (list[DocumentSnapshot]): Iterable of Firestore document snapshots containing
-                FHIR questionnaire data.
+            fhir_docs (Iterable[DocumentSnapshot]): Iterable of Firestore document snapshots
+                containing FHIR questionnaire data.
             user (DocumentReference): Firestore reference to the user document.
 
         Returns:
@@ -498,8 +710,7 @@ class QuestionnaireResponseCreator(ResourceCreator):
         resources = []
         for doc in fhir_docs:
             doc_dict = doc.to_dict()
-            resource_str = json.dumps(doc_dict)
-            resource_obj = QuestionnaireResponse.parse_raw(resource_str)
+            resource_obj = QuestionnaireResponse.parse_obj(doc_dict)
             if user:
                 resource_obj.subject = Reference(id=user.id)
             resources.append(resource_obj)
@@ -519,10 +730,7 @@ def get_code_mappings(code: str) -> tuple[str, str, str]:
         tuple[str, str, str]: A tuple containing the display string, code string, and system string
                                for the code. Returns (None, None, None) if the code is not found.
     """
-    loinc_processor = CodeProcessor()
-    code_mappings = loinc_processor.code_mappings.get(code)
-
-    if (code_mappings := loinc_processor.code_mappings.get(code)) is None:
+    if (code_mappings := _CODE_PROCESSOR.code_mappings.get(code)) is None:
         print(f"This LOINC code '{code}' is not supported.")
         return (None, None, None)
 
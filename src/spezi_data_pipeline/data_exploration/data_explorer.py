@@ -33,7 +33,8 @@ Functions:
 
 # Standard library imports
 from datetime import datetime
-from decimal import Decimal
+from functools import lru_cache
+from itertools import cycle, repeat
 from math import ceil
 
 # Related third-party imports
@@ -41,8 +42,14 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
 from matplotlib.ticker import AutoMinorLocator
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the ECG numerics then run as plain NumPy.
+    njit = None
+
 # Local application/library specific imports
 from spezi_data_pipeline.data_processing.data_processor import (
     select_data_by_dates,
@@ -54,16 +61,31 @@ from spezi_data_pipeline.data_flattening.fhir_resources_flattener import (
     ColumnNames,
 )
 
-
 TIME_UNIT = "sec"
 ECG_MICROVOLT_UNIT = "uV"
 ECG_MILLIVOLT_UNIT = "mV"
 DEFAULT_SAMPLE_RATE_VALUE = 500
 DEFAULT_DPI_VALUE = 300
+DEFAULT_ECG_DPI_VALUE = 100
 DEFAULT_LINE_WIDTH_VALUE = 0.5
 DEFAULT_AMPLITUDE_ECG = 1.8
 DEFAULT_TIME_TICKS = 0.2
 
+# Column names resolved once at import time; the plotting methods index DataFrames with
+# these on every user and LOINC code iteration.
+_USER_ID = ColumnNames.USER_ID.value
+_DT = ColumnNames.EFFECTIVE_DATE_TIME.value
+_QV = ColumnNames.QUANTITY_VALUE.value
+_QN = ColumnNames.QUANTITY_NAME.value
+_QU = ColumnNames.QUANTITY_UNIT.value
+_LOINC = ColumnNames.LOINC_CODE.value
+_ECG = ColumnNames.ECG_RECORDING.value
+_ECG_UNIT = ColumnNames.ECG_RECORDING_UNIT.value
+_SAMPLE_RATE = ColumnNames.SAMPLING_FREQUENCY.value
+_AUTHORED = ColumnNames.AUTHORED_DATE.value
+_STATIC_PLOT_COLUMNS = [_USER_ID, _DT, _QV, _QN, _QU, _LOINC]
+_ECG_PLOT_COLUMNS = [_USER_ID, _DT, _ECG, _ECG_UNIT, _SAMPLE_RATE]
+
 
 class DataExplorer:  # pylint: disable=unused-variable
     """
@@ -82,6 +104,7 @@ class DataExplorer:  # pylint: disable=unused-variable
         y_upper (float): Upper bound for the Y-axis. Defaults to 1000.
         combine_plots (bool): If True, combines data from multiple users into a single plot.
             Defaults to True.
+        show_plots (bool): If True, displays each generated plot. Defaults to True.
     """
 
     def __init__(self):
@@ -92,6 +115,7 @@ class DataExplorer:  # pylint: disable=unused-variable
         self.y_lower = None
         self.y_upper = None
         self.combine_plots = True
+        self.show_plots = True
 
     def set_date_range(self, start_date: str, end_date: str):
         """
@@ -139,6 +163,16 @@ class DataExplorer:  # pylint: disable=unused-variable
         """
         self.combine_plots = combine_plots
 
+    def set_show_plots(self, show_plots: bool):
+        """
+        Determines whether generated plots are displayed. Batch jobs that only save or
+        inspect the returned figures can disable this to skip the display pass.
+
+        Parameters:
+            show_plots (bool): Flag to display or only return the generated plots.
+        """
+        self.show_plots = show_plots
+
     def create_static_plot(self, fhir_dataframe: FHIRDataFrame) -> list:
         """
         Generates static plots based on the filtered FHIR data, offering combined or
@@ -154,7 +188,7 @@ class DataExplorer:  # pylint: disable=unused-variable
         figures = []
 
         if self.user_ids is None:
-            user_ids = fhir_dataframe.df[ColumnNames.USER_ID.value].unique()
+            user_ids = fhir_dataframe.df[_USER_ID].unique()
         else:
             user_ids = (
                 self.user_ids if isinstance(self.user_ids, list) else [self.user_ids]
@@ -169,23 +203,38 @@ class DataExplorer:  # pylint: disable=unused-variable
             print("No data for the selected date range.")
             return figures
 
-        loinc_codes = fhir_dataframe.df[ColumnNames.LOINC_CODE.value].unique()
+        # Only these columns are plotted; narrowing the frame once keeps the per-code and
+        # per-user slices below from copying the remaining FHIR columns.
+        df = fhir_dataframe.df[_STATIC_PLOT_COLUMNS]
+        loinc_frames = _partition_by(df, _LOINC)
 
-        for loinc_code in loinc_codes:
-            df_loinc = fhir_dataframe.df[
-                fhir_dataframe.df[ColumnNames.LOINC_CODE.value] == loinc_code
-            ]
+        for loinc_code in df[_LOINC].unique():
+            if (df_loinc := loinc_frames.get(loinc_code)) is None:
+                continue
 
             if self.combine_plots:
                 if fig := self.plot_combined(df_loinc, user_ids, loinc_code):
                     figures.append(fig)
             else:
+                user_frames = _partition_by(df_loinc, _USER_ID)
                 for user_id in user_ids:
-                    if fig := self.plot_individual(df_loinc, user_id, loinc_code):
+                    user_df = user_frames.get(user_id, df_loinc.iloc[:0])
+                    if fig := self.plot_individual(user_df, user_id, loinc_code):
                         figures.append(fig)
 
         return figures
 
+    def _date_range_title(self) -> str:
+        """
+        Describes the configured date range for use in plot titles.
+
+        Returns:
+            str: "for all dates" if no date range is set, otherwise "from <start> to <end>".
+        """
+        if not self.start_date and not self.end_date:
+            return "for all dates"
+        return f"from {self.start_date} to {self.end_date}"
+
     def plot_combined(
         self, df_loinc: pd.DataFrame, users_to_plot: list[str], loinc_code: str
     ) -> plt.Figure:
@@ -201,39 +250,35 @@ class DataExplorer:  # pylint: disable=unused-variable
             loinc_code (str): The LOINC code that the plot is focusing on.
 
         Returns:
-            matplotlib.figure.Figure: The figure object representing the combined plot.
+            matplotlib.figure.Figure: The figure object representing the combined plot, or
+                None if none of the users has data for the LOINC code.
         """
-        plt.figure(figsize=(10, 6), dpi=DEFAULT_DPI_VALUE)
-
-        for user_id in users_to_plot:
-            user_df = df_loinc[df_loinc[ColumnNames.USER_ID.value] == user_id]
-            _ = plot_data_based_on_condition(user_df, user_id)
+        user_frames = _partition_by(df_loinc, _USER_ID)
+        if not any(user_id in user_frames for user_id in users_to_plot):
+            print(f"No data found for the selected users and LOINC code {loinc_code}.")
+            return None
 
-        date_range_title = (
-            "for all dates"
-            if not self.start_date and not self.end_date
-            else f"from {self.start_date} to {self.end_date}"
+        fig, ax = plt.subplots(
+            figsize=(10, 6), dpi=DEFAULT_DPI_VALUE, constrained_layout=True
         )
-        plt.title(
-            f"{df_loinc[ColumnNames.QUANTITY_NAME.value].iloc[0]} "
-            f"for LOINC Code {loinc_code} {date_range_title}"
-        )
-        plt.xlabel("Date")
-        plt.ylabel(
-            f"{df_loinc[ColumnNames.QUANTITY_NAME.value].iloc[0]} "
-            f"({df_loinc[ColumnNames.QUANTITY_UNIT.value].iloc[0]})"
+
+        handles = _plot_users_combined(ax, user_frames, users_to_plot)
+
+        quantity_name = df_loinc[_QN].iat[0]
+        ax.set_title(
+            f"{quantity_name} for LOINC Code {loinc_code} {self._date_range_title()}"
         )
-        plt.legend()
-        plt.xticks(rotation=45)
-        plt.ylim(self.y_lower, self.y_upper)
-        plt.tight_layout()
+        ax.set_xlabel("Date")
+        ax.set_ylabel(f"{quantity_name} ({df_loinc[_QU].iat[0]})")
+        ax.legend(handles=handles)
+        ax.tick_params(axis="x", labelrotation=45)
+        ax.set_ylim(self.y_lower, self.y_upper)
 
-        fig = plt.gcf()
-        plt.show()
+        _show_and_release(fig, self.show_plots)
         return fig
 
     def plot_individual(
-        self, df_loinc: pd.DataFrame, user_id: str, loinc_code: str
+        self, user_df: pd.DataFrame, user_id: str, loinc_code: str
     ) -> plt.Figure:
         """
         Generates individual static plots for each specified user. For each user, their
@@ -242,7 +287,8 @@ class DataExplorer:  # pylint: disable=unused-variable
         specific LOINC code.
 
         Parameters:
-            df_loinc (DataFrame): A `DataFrame` filtered for a specific LOINC code.
+            user_df (DataFrame): A `DataFrame` filtered for a specific LOINC code and for
+                the user `user_id`.
             user_id (str): The user ID for which to generate the plot.
             loinc_code (str): The LOINC code that the plot is focusing on.
 
@@ -254,42 +300,251 @@ class DataExplorer:  # pylint: disable=unused-variable
             print("User ID must be provided for individual plots.")
             return None
 
-        user_df = df_loinc[df_loinc[ColumnNames.USER_ID.value] == user_id]
         if user_df.empty:
             print(f"No data found for user ID {user_id} and LOINC code {loinc_code}.")
             return None
 
-        plt.figure(figsize=(10, 6), dpi=DEFAULT_DPI_VALUE)
-        date_range_title = (
-            "for all dates"
-            if not self.start_date and not self.end_date
-            else f"from {self.start_date} to {self.end_date}"
+        fig, ax = plt.subplots(
+            figsize=(10, 6), dpi=DEFAULT_DPI_VALUE, constrained_layout=True
         )
-        plt.title(
-            f"{user_df[ColumnNames.QUANTITY_NAME.value].iloc[0]} "
-            f"for User ID {user_id} {date_range_title}"
+        quantity_name = user_df[_QN].iat[0]
+        ax.set_title(
+            f"{quantity_name} for User ID {user_id} {self._date_range_title()}"
         )
 
-        _ = plot_data_based_on_condition(user_df, user_id)
+        _ = plot_data_based_on_condition(user_df, user_id, ax)
+
+        ax.set_xlabel("Date")
+        ax.set_ylabel(f"{quantity_name} ({user_df[_QU].iat[0]})")
+        ax.legend()
+        ax.tick_params(axis="x", labelrotation=45)
+        ax.set_ylim(self.y_lower, self.y_upper)
+
+        _show_and_release(fig, self.show_plots)
+        return fig
+
+
+def _partition_by(df: pd.DataFrame, column: str) -> dict[str, pd.DataFrame]:
+    """
+    Splits a `DataFrame` into one frame per value of a column, e.g. per user or per LOINC
+    code. The data is sorted by that column once so that the rows of every value form a
+    contiguous block, which is then sliced positionally instead of scanning the whole frame
+    with a boolean mask for each value. The sort is stable, so each block keeps the original
+    row order.
+
+    Parameters:
+        df (pd.DataFrame): The `DataFrame` to partition.
+        column (str): The name of the column to partition by.
+
+    Returns:
+        dict[str, pd.DataFrame]: A mapping from each column value to the rows with that value.
+    """
+    if df.empty:
+        return {}
+
+    df = df.sort_values(column, kind="stable", ignore_index=True)
+    keys = df[column].to_numpy()
+    bounds = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [len(df)]))
+
+    return {keys[lo]: df.iloc[lo:hi] for lo, hi in zip(starts, ends)}
+
+
+def _plot_users_combined(
+    ax: Axes, user_frames: dict[str, pd.DataFrame], user_ids: list[str]
+) -> list:
+    """
+    Plots the data of several users into one axes. As in `plot_data_based_on_condition`,
+    users with unique timestamps are drawn as bars and users with duplicate timestamps as
+    scatter points, but all scatter users are drawn by a single `scatter` call with one
+    color per user instead of one collection per user.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axes to draw on.
+        user_frames (dict[str, pd.DataFrame]): The data of each user, keyed by user ID.
+        user_ids (list[str]): The IDs of the users to plot, in legend order. Users without
+            data are skipped.
+
+    Returns:
+        list: The legend handles, one per plotted user.
+    """
+    colors = cycle(plt.rcParams["axes.prop_cycle"].by_key()["color"])
+    handles = []
+    scatter_x, scatter_y, scatter_colors = [], [], []
+
+    for user_id in user_ids:
+        if (user_df := user_frames.get(user_id)) is None:
+            continue
+
+        color = next(colors)
+        if user_df[_DT].is_unique:
+            handles.append(
+                ax.bar(
+                    user_df[_DT].to_numpy(),
+                    user_df[_QV].to_numpy(),
+                    color=color,
+                    label=f"User {user_id}",
+                    edgecolor="black",
+                    linewidth=1.5,
+                )
+            )
+        else:
+            scatter_x.append(user_df[_DT].to_numpy())
+            scatter_y.append(user_df[_QV].to_numpy())
+            scatter_colors.extend([color] * len(user_df))
+            handles.append(
+                Line2D(
+                    [],
+                    [],
+                    linestyle="",
+                    marker="o",
+                    color=color,
+                    markeredgecolor="black",
+                    label=f"User {user_id}",
+                )
+            )
 
-        plt.xlabel("Date")
-        plt.ylabel(
-            f"{user_df[ColumnNames.QUANTITY_NAME.value].iloc[0]} "
-            f"({user_df[ColumnNames.QUANTITY_UNIT.value].iloc[0]})"
+    if scatter_x:
+        ax.scatter(
+            np.concatenate(scatter_x),
+            np.concatenate(scatter_y),
+            c=scatter_colors,
+            edgecolor="black",
+            linewidth=1.5,
         )
-        plt.legend()
-        plt.xticks(rotation=45)
-        plt.ylim(self.y_lower, self.y_upper)
-        plt.tight_layout()
 
-        fig = plt.gcf()
+    return handles
+
+
+def _show_and_release(fig: plt.Figure, show: bool = True) -> None:
+    """
+    Displays a figure and then drops it from pyplot's figure registry. The returned figure
+    object stays fully usable (e.g., for `savefig`), but pyplot no longer keeps a reference
+    to it, so generating plots for many users does not accumulate open figures.
+
+    Parameters:
+        fig (matplotlib.figure.Figure): The figure to display and release.
+        show (bool, optional): Whether to display the figure before releasing it.
+            Defaults to True.
+    """
+    if show:
         plt.show()
-        return fig
+    plt.close(fig)
 
 
-def plot_data_based_on_condition(user_df: pd.DataFrame, user_id: str) -> dict:
+def _lttb_indices(x: np.ndarray, y: np.ndarray, edges: np.ndarray) -> np.ndarray:
     """
-    Dynamically plots data using either plt.scatter or plt.bar based on the condition
+    Selects the indices kept by Largest-Triangle-Three-Buckets downsampling. Written as a
+    plain loop over NumPy arrays so that it can be compiled with Numba when available.
+
+    Parameters:
+        x (np.ndarray): The x values of the series, in ascending order.
+        y (np.ndarray): The y values of the series.
+        edges (np.ndarray): The bucket edges as produced by `_lttb`, ending with `len(y)`.
+
+    Returns:
+        np.ndarray: The indices of the selected points, one per edge.
+    """
+    selected = np.empty(len(edges), dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = edges[-1] - 1
+
+    a = 0
+    for i in range(len(edges) - 2):
+        lo, hi, next_hi = edges[i], edges[i + 1], edges[i + 2]
+        area = np.abs(
+            (x[a] - x[hi:next_hi].mean()) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (y[hi:next_hi].mean() - y[a])
+        )
+        a = lo + np.argmax(area)
+        selected[i + 1] = a
+
+    return selected
+
+
+if njit is not None:
+    _lttb_indices = njit(cache=True)(_lttb_indices)
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Downsamples a series with the Largest-Triangle-Three-Buckets algorithm. The first and
+    last points are kept; every bucket in between contributes the point forming the largest
+    triangle with the previously selected point and the mean of the next bucket, which
+    preserves peaks such as QRS complexes far better than uniform decimation.
+
+    Parameters:
+        x (np.ndarray): The x values of the series, in ascending order.
+        y (np.ndarray): The y values of the series.
+        n_out (int): The number of points to keep.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The downsampled x and y values. The inputs are
+            returned unchanged if they already have no more than `n_out` points.
+    """
+    n_in = len(y)
+    n_buckets = n_out - 2  # The first and last samples are always kept.
+    if n_out >= n_in or n_buckets < 1:
+        return x, y
+
+    # Edges of the buckets between the fixed first and last samples; the final edge is
+    # followed by the last sample, which serves as the last "next bucket".
+    edges = np.append(np.linspace(1, n_in - 1, n_buckets + 1).astype(np.intp), n_in)
+    selected = _lttb_indices(x, y, edges)
+
+    return x[selected], y[selected]
+
+
+@lru_cache(maxsize=32)
+def _ecg_ticks(
+    secs: float, time_ticks: float, amplitude: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the major tick positions of an ECG grid. The ticks only depend on the recording
+    duration and the grid settings, which are shared by all parts of a recording and usually
+    by all recordings of a user, so they are cached; the arrays are read-only because the
+    same objects are handed to every axis.
+
+    Parameters:
+        secs (float): The duration of the plotted ECG segment in seconds.
+        time_ticks (float): The spacing of the major time ticks in seconds.
+        amplitude (float): The amplitude limit of the ECG axis in mV.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The x (time) and y (amplitude) tick positions.
+    """
+    x_ticks = np.arange(0, secs + time_ticks, time_ticks)
+    y_ticks = np.arange(-ceil(amplitude), ceil(amplitude), 1.0)
+    x_ticks.setflags(write=False)
+    y_ticks.setflags(write=False)
+    return x_ticks, y_ticks
+
+
+def _parse_ecg_recording(recording: str) -> np.ndarray:
+    """
+    Parses a whitespace-separated ECG recording string into a float32 array. The string is
+    parsed in C by `np.fromstring` without building an intermediate list of tokens; float32
+    keeps well beyond the precision of recorded ECG samples at half the memory of float64.
+    The returned array is read-only because `ECGExplorer` caches it and hands the same object
+    to every caller.
+
+    Parameters:
+        recording (str): The ECG samples as stored in the `ECGRecording` column.
+
+    Returns:
+        np.ndarray: The parsed, read-only ECG samples.
+    """
+    ecg_array = np.fromstring(recording, dtype=np.float32, sep=" ")
+    ecg_array.setflags(write=False)
+    return ecg_array
+
+
+def plot_data_based_on_condition(
+    user_df: pd.DataFrame, user_id: str, ax: Axes | None = None
+) -> dict:
+    """
+    Dynamically plots data using either a scatter or a bar plot based on the condition
     of duplicate `EffectiveDateTime` entries for a user. Utilizes scatter plots for datasets
     with duplicate timestamps and bar plots for datasets with unique timestamps, allowing
     for appropriate visualization of the data distribution.
@@ -297,21 +552,27 @@ def plot_data_based_on_condition(user_df: pd.DataFrame, user_id: str) -> dict:
     Parameters:
         user_df (pd.DataFrame): The `DataFrame` containing data for a specific user.
         user_id (str): The ID of the user for which the data is being plotted.
+        ax (matplotlib.axes.Axes, optional): The axes to draw on. If None, the current
+            pyplot axes are used.
 
     Returns:
         dict: Information about the plot, including the chosen plot type ('scatter' or 'bar')
               and the `DataFrame` used for plotting.
     """
-    if user_df.duplicated(subset=[ColumnNames.EFFECTIVE_DATE_TIME.value]).any():
+    if ax is None:
+        ax = plt.gca()
+
+    if not user_df[_DT].is_unique:
         plot_type = "scatter"
-        plot_function = plt.scatter
+        plot_function = ax.scatter
     else:
         plot_type = "bar"
-        plot_function = plt.bar
+        plot_function = ax.bar
 
+    # Plain arrays skip matplotlib's per-call pandas unit conversion.
     plot_function(
-        user_df[ColumnNames.EFFECTIVE_DATE_TIME.value],
-        user_df[ColumnNames.QUANTITY_VALUE.value],
+        user_df[_DT].to_numpy(),
+        user_df[_QV].to_numpy(),
         label=f"User {user_id}",
         edgecolor="black",
         linewidth=1.5,
@@ -320,7 +581,7 @@ def plot_data_based_on_condition(user_df: pd.DataFrame, user_id: str) -> dict:
     return {"plot_type": plot_type, "data_frame": user_df}
 
 
-class ECGExplorer:  # pylint: disable=unused-variable
+class ECGExplorer:  # pylint: disable=unused-variable, too-many-instance-attributes
     """
     A visualization tool for electrocardiogram (ECG) data that extends the DataExplorer class.
     This class provides specialized plotting functions to render ECG waveforms from FHIR data frames
@@ -334,7 +595,8 @@ class ECGExplorer:  # pylint: disable=unused-variable
     def __init__(self):
         """
         Initializes the ECGExplorer with default parameters for ECG data visualization.
-        Sets line width, date range, user IDs, amplitude scale, and time ticks for plotting.
+        Sets line width, date range, user IDs, amplitude scale, time ticks, waveform
+        downsampling, plot display, and figure resolution for plotting.
         """
         self.lwidth = DEFAULT_LINE_WIDTH_VALUE
         self.start_date = None
@@ -342,6 +604,12 @@ class ECGExplorer:  # pylint: disable=unused-variable
         self.user_ids = None
         self.amplitude_ecg = DEFAULT_AMPLITUDE_ECG
         self.time_ticks = DEFAULT_TIME_TICKS
+        self.downsample = True
+        self.show_plots = True
+        self.dpi_ecg = DEFAULT_ECG_DPI_VALUE
+        # Parsed recordings are cached per explorer, so re-plotting the same observations
+        # skips the parse and the waveforms are released together with the explorer.
+        self._parse_recording = lru_cache(maxsize=128)(_parse_ecg_recording)
 
     def set_date_range(self, start_date: str, end_date: str) -> None:
         """
@@ -369,6 +637,36 @@ class ECGExplorer:  # pylint: disable=unused-variable
         """
         self.user_ids = user_ids if isinstance(user_ids, list) else [user_ids]
 
+    def set_downsample(self, downsample: bool) -> None:
+        """
+        Determines whether ECG waveforms with more samples than the axes can resolve are
+        downsampled before plotting.
+
+        Parameters:
+            downsample (bool): Flag to downsample long ECG waveforms before plotting.
+        """
+        self.downsample = downsample
+
+    def set_show_plots(self, show_plots: bool) -> None:
+        """
+        Determines whether generated ECG plots are displayed. Batch jobs that only save or
+        inspect the returned figures can disable this to skip the display pass.
+
+        Parameters:
+            show_plots (bool): Flag to display or only return the generated plots.
+        """
+        self.show_plots = show_plots
+
+    def set_dpi_ecg(self, dpi_ecg: int) -> None:
+        """
+        Sets the resolution of generated ECG figures. The default suits on-screen use; raise
+        it (e.g., to `DEFAULT_DPI_VALUE`) for publication-quality figures.
+
+        Parameters:
+            dpi_ecg (int): The resolution of ECG figures in dots per inch.
+        """
+        self.dpi_ecg = dpi_ecg
+
     def _ax_plot(self, ax: Axes, x: np.ndarray, y: np.ndarray, secs: int) -> None:
         """
         Configures the axes for plotting ECG data on a given matplotlib axis object,
@@ -380,14 +678,17 @@ class ECGExplorer:  # pylint: disable=unused-variable
             y (np.ndarray): The array of amplitude values for the ECG data points.
             secs (int): The total duration of the ECG recording in seconds.
         """
-        ax.set_xticks(np.arange(0, secs + self.time_ticks, self.time_ticks))
-        ax.set_yticks(
-            np.arange(-ceil(self.amplitude_ecg), ceil(self.amplitude_ecg), 1.0)
-        )
+        x_ticks, y_ticks = _ecg_ticks(secs, self.time_ticks, self.amplitude_ecg)
+        ax.set_xticks(x_ticks)
+        ax.set_yticks(y_ticks)
         ax.minorticks_on()
         ax.xaxis.set_minor_locator(AutoMinorLocator(5))
         ax.set_ylim(-self.amplitude_ecg, self.amplitude_ecg)
         ax.set_xlim(0, secs)
+        if self.downsample:
+            # Two points per horizontal pixel keep the waveform visually unchanged.
+            fig_width = ax.figure.get_size_inches()[0]
+            x, y = _lttb(x, y, int(fig_width * ax.figure.dpi * 2))
         ax.grid(
             which="major",
             linestyle="-",
@@ -400,7 +701,9 @@ class ECGExplorer:  # pylint: disable=unused-variable
             linewidth=f"{DEFAULT_LINE_WIDTH_VALUE}",
             color=(1, 0.7, 0.7),
         )
-        ax.plot(x, y, linewidth=self.lwidth)
+        # Rasterizing the trace keeps vector exports from embedding every sample as a path
+        # vertex; the grid and labels stay vector graphics.
+        ax.plot(x, y, linewidth=self.lwidth, rasterized=True)
 
     def plot_single_user_ecg(
         self, user_data: pd.DataFrame, user_id: str
@@ -418,54 +721,68 @@ class ECGExplorer:  # pylint: disable=unused-variable
             list: A list of matplotlib.figure.Figure objects representing the generated ECG plots.
         """
         figures = []
-        for _, row in user_data.iterrows():
-            fig, axs = plt.subplots(3, 1, figsize=(15, 6), constrained_layout=True)
-            effective_date = row[ColumnNames.EFFECTIVE_DATE_TIME.value].strftime(
-                "%Y-%m-%d"
-            )
-
-            if row[ColumnNames.ECG_RECORDING.value] is not None:
-                if isinstance(row[ColumnNames.ECG_RECORDING.value], list):
-                    ecg_array = np.array(
-                        row[ColumnNames.ECG_RECORDING.value], dtype=float
-                    )
-                else:
-                    ecg_array = np.array(
-                        row[ColumnNames.ECG_RECORDING.value].split(), dtype=float
-                    )
-
-                if row[ColumnNames.ECG_RECORDING_UNIT.value] == ECG_MICROVOLT_UNIT:
-                    ecg_array = ecg_array / 1000  # Convert uV to mV
-                elif row[ColumnNames.ECG_RECORDING_UNIT.value] != ECG_MICROVOLT_UNIT:
+        # Iterate the needed columns directly instead of boxing every row into a Series.
+        for effective_date, recording, unit, rate in zip(
+            user_data[_DT],
+            user_data[_ECG],
+            user_data[_ECG_UNIT],
+            (
+                user_data[_SAMPLE_RATE]
+                if _SAMPLE_RATE in user_data.columns
+                else repeat(DEFAULT_SAMPLE_RATE_VALUE)
+            ),
+        ):
+            if recording is not None:
+                # Check the unit before creating the figure, so that no figure is left open
+                # when plotting stops here.
+                if unit not in (ECG_MICROVOLT_UNIT, ECG_MILLIVOLT_UNIT):
                     print(
                         "ECG units must be in either uV or mV. Check units and plot again."
                     )
                     return figures
 
-                sample_rate = row.get(
-                    ColumnNames.SAMPLING_FREQUENCY.value, DEFAULT_SAMPLE_RATE_VALUE
-                )
+                fig, axs = plt.subplots(3, 1, figsize=(15, 6), dpi=self.dpi_ecg)
+                if isinstance(recording, list):
+                    ecg_array = np.array(recording, dtype=np.float32)
+                else:
+                    ecg_array = self._parse_recording(recording)
 
-                split_length = len(ecg_array) // 3
-                ecg_parts = [
-                    ecg_array[i * split_length : (i + 1) * split_length]
-                    for i in range(3)
-                ]
+                if unit == ECG_MICROVOLT_UNIT:
+                    ecg_array = ecg_array / 1000  # Convert uV to mV
+
+                # Firestore may hand the rate back as a Decimal; convert it once here
+                # for all three parts.
+                sample_rate = float(rate)
+
+                # A zero-copy view with one row per part; trailing samples that do not fill
+                # a whole part are left out.
+                ecg_parts = ecg_array[: len(ecg_array) // 3 * 3].reshape(3, -1)
+                # All three parts have the same length and rate, so they share one time axis.
+                time_axis = (
+                    np.arange(ecg_parts.shape[1], dtype=np.float32) / sample_rate
+                )
 
-                for i, ecg in enumerate(ecg_parts):
-                    title = f"ECG Part {i+1} for User {user_id} on {effective_date}"
-                    self._plot_single_lead_ecg(ecg, sample_rate, title, axs[i])
-            else:
                 for i in range(3):
-                    axs[i].text(
-                        0.5,
-                        0.5,
-                        "No ECG data available for this recording.",
-                        ha="center",
-                        va="center",
-                        transform=axs[i].transAxes,
+                    self._plot_single_lead_ecg(
+                        ecg_parts[i],
+                        sample_rate,
+                        f"ECG Part {i+1} for User {user_id} on "
+                        f"{effective_date.strftime('%Y-%m-%d')}",
+                        axs[i],
+                        time_axis,
                     )
-            plt.show()
+            else:
+                # No axes are needed to report a missing recording.
+                fig = plt.figure(figsize=(15, 2), dpi=self.dpi_ecg)
+                fig.text(
+                    0.5,
+                    0.5,
+                    "No ECG data available for this recording.",
+                    ha="center",
+                    va="center",
+                )
+            fig.tight_layout()
+            _show_and_release(fig, self.show_plots)
             figures.append(fig)
         return figures
 
@@ -489,28 +806,19 @@ class ECGExplorer:  # pylint: disable=unused-variable
         users_to_plot = (
             self.user_ids
             if self.user_ids is not None
-            else fhir_dataframe.df[ColumnNames.USER_ID.value].unique()
+            else fhir_dataframe.df[_USER_ID].unique()
         )
-        for user_id in users_to_plot:
-            # Filter data based on user_id and date range
-            if self.start_date and self.end_date:
-                user_data = fhir_dataframe.df[
-                    (fhir_dataframe.df[ColumnNames.USER_ID.value] == user_id)
-                    & (
-                        fhir_dataframe.df[ColumnNames.EFFECTIVE_DATE_TIME.value]
-                        >= self.start_date
-                    )
-                    & (
-                        fhir_dataframe.df[ColumnNames.EFFECTIVE_DATE_TIME.value]
-                        <= self.end_date
-                    )
-                ]
-            else:
-                user_data = fhir_dataframe.df[
-                    fhir_dataframe.df[ColumnNames.USER_ID.value] == user_id
-                ]
+        # Filter by date range once, then split the remaining rows by user in a single pass.
+        # Only the plotted columns are kept, so the split does not copy the other columns;
+        # the sampling frequency is optional.
+        df = fhir_dataframe.df
+        df = df[[column for column in _ECG_PLOT_COLUMNS if column in df.columns]]
+        if self.start_date and self.end_date:
+            df = df[(df[_DT] >= self.start_date) & (df[_DT] <= self.end_date)]
+        user_frames = _partition_by(df, _USER_ID)
 
-            if not user_data.empty:
+        for user_id in users_to_plot:
+            if (user_data := user_frames.get(user_id)) is not None:
                 figures.extend(self.plot_single_user_ecg(user_data, user_id))
             else:
                 print(
@@ -522,9 +830,10 @@ class ECGExplorer:  # pylint: disable=unused-variable
     def _plot_single_lead_ecg(
         self,
         ecg: np.ndarray,
-        sample_rate: int = DEFAULT_SAMPLE_RATE_VALUE,
+        sample_rate: float = DEFAULT_SAMPLE_RATE_VALUE,
         title: str = "ECG",
         ax: plt.Axes | None = None,
+        time_axis: np.ndarray | None = None,
     ) -> None:
         """
         Helper function to plot a single lead ECG waveform on a specified axes object.
@@ -533,25 +842,27 @@ class ECGExplorer:  # pylint: disable=unused-variable
 
         Parameters:
             ecg (np.ndarray): The ECG waveform data points to plot.
-            sample_rate (int, optional): The sample rate of the ECG recording, defaulting
-                to a standard value.
+            sample_rate (float, optional): The sample rate of the ECG recording in Hz,
+                defaulting to a standard value.
             title (str, optional): The title for the subplot, defaulting to "ECG".
             ax (matplotlib.axes.Axes, optional): The axes object on which to plot the ECG.
                 If None, a new axes will be created.
+            time_axis (np.ndarray, optional): The time of each ECG sample in seconds. If None,
+                it is computed from the sample rate.
         """
         if ax is None:
-            _, ax = plt.subplots(figsize=(15, 2))
+            _, ax = plt.subplots(figsize=(15, 2), dpi=self.dpi_ecg)
 
         ax.set_title(title)
         ax.set_ylabel(f"ECG ({ECG_MILLIVOLT_UNIT})")
         ax.set_xlabel(f"Time ({TIME_UNIT})")
 
-        if isinstance(sample_rate, Decimal):
-            sample_rate = float(sample_rate)
+        if time_axis is None:
+            # Sample indices scaled by the rate always yield exactly len(ecg) time points,
+            # unlike a float-step arange whose stop condition can drift by one.
+            time_axis = np.arange(len(ecg), dtype=np.float32) / sample_rate
 
-        seconds = len(ecg) / sample_rate
-        step = 1.0 / sample_rate
-        self._ax_plot(ax, np.arange(0, len(ecg) * step, step), ecg, seconds)
+        self._ax_plot(ax, time_axis, ecg, len(ecg) / sample_rate)
 
 
 class QuestionnaireResponseExplorer:  # pylint: disable=unused-variable
@@ -567,6 +878,7 @@ class QuestionnaireResponseExplorer:  # pylint: disable=unused-variable
         user_ids (list[str], optional): List of user IDs to filter the data for visualization.
                                         Defaults to None.
         questionnaire_title (str): The title of the questionnaire for score calculation. Required.
+        show_plots (bool): If True, displays the generated plot. Defaults to True.
     """
 
     def __init__(self, questionnaire_title):
@@ -578,6 +890,7 @@ class QuestionnaireResponseExplorer:  # pylint: disable=unused-variable
         self.end_date = None
         self.user_ids = None
         self.questionnaire_title = questionnaire_title
+        self.show_plots = True
 
     def set_date_range(self, start_date: str, end_date: str):
         """Sets the start and end dates for filtering the data before visualization."""
@@ -592,6 +905,10 @@ class QuestionnaireResponseExplorer:  # pylint: disable=unused-variable
         """Sets the list of user IDs to filter the data for visualization."""
         self.user_ids = user_ids
 
+    def set_show_plots(self, show_plots: bool):
+        """Sets whether the generated plot is displayed or only returned."""
+        self.show_plots = show_plots
+
     def create_score_plot(self, fhir_dataframe: FHIRDataFrame):
         """
         Calculates risk scores and generates plots based on the filtered data.
@@ -608,42 +925,47 @@ class QuestionnaireResponseExplorer:  # pylint: disable=unused-variable
                 fhir_dataframe, self.start_date, self.end_date
             )
 
+        # Only the plain frame is used from here on, so the user filter does not need to be
+        # wrapped in a new FHIRDataFrame.
+        df = fhir_dataframe.df
         if self.user_ids:
-            filtered_df = fhir_dataframe.df[
-                fhir_dataframe.df[ColumnNames.USER_ID.value].isin(self.user_ids)
-            ]
-            fhir_dataframe = FHIRDataFrame(
-                filtered_df, resource_type=fhir_dataframe.resource_type
-            )
+            df = df[df[_USER_ID].isin(self.user_ids)]
 
-        if fhir_dataframe.df.empty:
+        if df.empty:
             print("No data for the selected date range and user IDs.")
             return None
 
-        plt.figure(figsize=(10, 6))
-        for user_id in fhir_dataframe.df[ColumnNames.USER_ID.value].unique():
-            user_df = fhir_dataframe.df[
-                fhir_dataframe.df[ColumnNames.USER_ID.value] == user_id
-            ]
-            plt.plot(
-                user_df[ColumnNames.AUTHORED_DATE.value],
+        fig, ax = plt.subplots(figsize=(10, 6))
+        # One groupby pass yields every user's scores in order of first appearance,
+        # instead of masking the whole frame once per user.
+        for user_id, user_df in df.groupby(_USER_ID, sort=False):
+            ax.plot(
+                user_df[_AUTHORED],
                 user_df["RiskScore"],
                 label=f"User {user_id}",
                 marker="o",
             )
 
-        plt.title(f"{self.questionnaire_title} Scores Over Time")
-        plt.xlabel("Date")
-        plt.ylabel("Risk Score")
-        plt.legend()
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax.set_title(f"{self.questionnaire_title} Scores Over Time")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Risk Score")
+        ax.legend()
+        ax.tick_params(axis="x", labelrotation=45)
+        fig.tight_layout()
 
-        fig = plt.gcf()
-        plt.show()
+        _show_and_release(fig, self.show_plots)
         return fig
 
 
+# Explorer class per resource type. Explorers keep the filters set through their `set_*`
+# methods, so the factory maps to classes and builds a fresh instance on every call.
+_EXPLORER_CLASSES = {
+    FHIRResourceType.OBSERVATION: DataExplorer,
+    FHIRResourceType.ECG_OBSERVATION: ECGExplorer,
+    FHIRResourceType.QUESTIONNAIRE_RESPONSE: QuestionnaireResponseExplorer,
+}
+
+
 def visualizer_factory(  # pylint: disable=unused-variable
     fhir_dataframe: FHIRDataFrame | pd.DataFrame, questionnaire_title: str = None
 ):
@@ -661,19 +983,16 @@ def visualizer_factory(  # pylint: disable=unused-variable
         An instance of DataExplorer, ECGExplorer, or QuestionnaireResponseExplorer based on the
         resource_type.
     """
-    if fhir_dataframe.resource_type == FHIRResourceType.OBSERVATION:
-        return DataExplorer()
-    if fhir_dataframe.resource_type == FHIRResourceType.ECG_OBSERVATION:
-        return ECGExplorer()
-    if fhir_dataframe.resource_type == FHIRResourceType(
-        FHIRResourceType.QUESTIONNAIRE_RESPONSE
-    ):
+    explorer_class = _EXPLORER_CLASSES.get(fhir_dataframe.resource_type)
+    if explorer_class is None:
+        raise ValueError(f"Unsupported resource type: {fhir_dataframe.resource_type}")
+    if explorer_class is QuestionnaireResponseExplorer:
         if questionnaire_title is None:
             raise ValueError(
                 "Questionnaire title must be provided for QuestionnaireResponse type"
             )
         return QuestionnaireResponseExplorer(questionnaire_title)
-    raise ValueError(f"Unsupported resource type: {fhir_dataframe.resource_type}")
+    return explorer_class()
 
 
 def explore_total_records_number(  # pylint: disable=unused-variable
@@ -701,42 +1020,35 @@ def explore_total_records_number(  # pylint: disable=unused-variable
     - None
     """
 
-    df[ColumnNames.EFFECTIVE_DATE_TIME.value] = pd.to_datetime(
-        df[ColumnNames.EFFECTIVE_DATE_TIME.value]
-    )
+    # Parse only when needed, and on a new frame so the caller's DataFrame is left untouched.
+    if not pd.api.types.is_datetime64_any_dtype(df[_DT]):
+        df = df.assign(**{_DT: pd.to_datetime(df[_DT])})
 
     if start_date is not None and end_date is not None:
-        df = df[
-            (df[ColumnNames.EFFECTIVE_DATE_TIME.value] >= start_date)
-            & (df[ColumnNames.EFFECTIVE_DATE_TIME.value] <= end_date)
-        ]
+        df = df[(df[_DT] >= start_date) & (df[_DT] <= end_date)]
 
     if isinstance(user_ids, str):
         user_ids = [user_ids]
 
     if user_ids is not None:
-        df = df[df[ColumnNames.USER_ID.value].isin(user_ids)]
+        df = df[df[_USER_ID].isin(user_ids)]
 
-    counts = (
-        df.groupby([ColumnNames.LOINC_CODE.value, ColumnNames.USER_ID.value])
-        .size()
-        .unstack(fill_value=0)
-    )
+    counts = df.groupby([_LOINC, _USER_ID]).size().unstack(fill_value=0)
 
-    plt.figure(figsize=(20, 10))
-    ax = counts.plot(kind="bar", stacked=True, figsize=(20, 10))
-    plt.title("Number of Records by LOINC Code", fontsize=20)
-    plt.xlabel("LOINC Code", fontsize=20)
-    plt.ylabel("Count", fontsize=20)
-    plt.xticks(rotation=45, ha="right", fontsize=16)
-    plt.legend(
+    fig, ax = plt.subplots(figsize=(20, 10))
+    counts.plot(kind="bar", stacked=True, ax=ax)
+    ax.set_title("Number of Records by LOINC Code", fontsize=20)
+    ax.set_xlabel("LOINC Code", fontsize=20)
+    ax.set_ylabel("Count", fontsize=20)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha="right", fontsize=16)
+    ax.legend(
         title="User ID",
         fontsize=14,
         title_fontsize=14,
         bbox_to_anchor=(1.05, 1),
         loc="upper left",
     )
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    _show_and_release(fig)
 
-    return ax # For test inspection
+    return ax  # For test inspection
@@ -36,6 +36,12 @@ from spezi_data_pipeline.data_exploration.data_explorer import (
     DEFAULT_DPI_VALUE,
 )
 
+# Explorer class and plotting method used to export the plots of each resource type.
+_PLOTTERS = {  # pylint: disable=consider-using-namedtuple-or-dataclass
+    FHIRResourceType.OBSERVATION: (DataExplorer, DataExplorer.create_static_plot),
+    FHIRResourceType.ECG_OBSERVATION: (ECGExplorer, ECGExplorer.plot_ecg_subplots),
+}
+
 
 class DataExporter(DataExplorer, ECGExplorer):  # pylint: disable=unused-variable
     """
@@ -68,7 +74,13 @@ class DataExporter(DataExplorer, ECGExplorer):  # pylint: disable=unused-variabl
             flattened_fhir_dataframe (FHIRDataFrame): The FHIRDataFrame to be used for
                 data export and exploration.
         """
+        # DataExplorer.__init__ does not chain to ECGExplorer, whose ECG plot settings the
+        # exporter needs as well; shared attributes keep the DataExplorer defaults.
+        ECGExplorer.__init__(self)
         super().__init__()
+        # Exported ECG figures are drawn and saved at the same resolution, print quality
+        # unless changed with set_dpi_ecg.
+        self.dpi_ecg = DEFAULT_DPI_VALUE
         self.flattened_fhir_dataframe = flattened_fhir_dataframe
 
     def export_to_csv(self, filename):
@@ -132,41 +144,32 @@ class DataExporter(DataExplorer, ECGExplorer):  # pylint: disable=unused-variabl
         if not self.user_ids:
             return  # Do not proceed with plot creation.
 
-        # Assuming that figs can either be a single figure or
-        # a list of (list of figures, user_id) tuples
+        # Pairs of (figure, user_id), so that every saved file names its user
         figs = []
-        if self.flattened_fhir_dataframe.resource_type in [
-            FHIRResourceType.OBSERVATION,
-            FHIRResourceType.ECG_OBSERVATION,
-        ]:
+        if (
+            plotter := _PLOTTERS.get(self.flattened_fhir_dataframe.resource_type)
+        ) is not None:
+            explorer_class, plot_method = plotter
             for user_id in user_ids:
-                if (
-                    self.flattened_fhir_dataframe.resource_type
-                    == FHIRResourceType.OBSERVATION
+                data_visualizer = explorer_class()
+                # Filter for one user at a time if multiple are provided
+                data_visualizer.set_user_ids([user_id])
+                # The figures are only saved, so displaying them would block batch exports
+                data_visualizer.set_show_plots(False)
+                if isinstance(data_visualizer, ECGExplorer):
+                    # Exported files are written at a higher resolution than the screen
+                    # figure the downsampling budget is sized for, so keep every sample.
+                    data_visualizer.set_downsample(False)
+                    data_visualizer.set_dpi_ecg(self.dpi_ecg)
+                if fig_list := plot_method(
+                    data_visualizer, self.flattened_fhir_dataframe
                 ):
-                    data_visualizer = DataExplorer()
-                    data_visualizer.set_user_ids(
-                        [user_id]
-                    )  # Filter for one user at a time if multiple are provided
-                    fig_list = data_visualizer.create_static_plot(
-                        self.flattened_fhir_dataframe
-                    )
-                    if fig_list:
-                        figs.extend([(fig, user_id) for fig in fig_list])
-                else:  # FHIRResourceType.ECG_OBSERVATION
-                    ecg_data_visualizer = ECGExplorer()
-                    ecg_data_visualizer.set_user_ids(
-                        [user_id]
-                    )  # Filter for one user at a time if multiple are provided
-                    fig_list = ecg_data_visualizer.plot_ecg_subplots(
-                        self.flattened_fhir_dataframe
-                    )
-                    if fig_list:
-                        figs.extend([(fig, user_id) for fig in fig_list])
+                    figs.extend([(fig, user_id) for fig in fig_list])
 
         for idx, (fig, user_id) in enumerate(figs, start=1):
             filename = self.create_filename(base_filename, user_id, idx)
-            fig.savefig(filename, dpi=DEFAULT_DPI_VALUE)
+            # Save at the resolution the figure was drawn at
+            fig.savefig(filename, dpi="figure")
             print(f"Plot saved successfully to: {filename}")
         if not figs:
             print("No plots were generated.")
@@ -29,6 +29,7 @@ Main Components:
 - `extract_coding_info` and `extract_component_info`: Helper functions for extracting detailed
                                                       information from Observation components and
                                                       codings.
+- `to_utc_dates`: Converts effective date times into the UTC dates stored in the flattened data.
 - `QuestionnaireResponseFlattener`: Flattens `QuestionnaireResponse` resources into a DataFrame,
                                     mapping questions and answers to their respective text using
                                     Phoenix-generated questionnaire JSON files.
@@ -44,7 +45,7 @@ Main Components:
 """
 
 # Standard library imports
-from datetime import date
+from datetime import date, datetime, timezone
 from enum import Enum
 import re
 import json
@@ -61,6 +62,9 @@ from fhir.resources.R4B.questionnaireresponse import QuestionnaireResponseItem
 ENCODING = "utf-8"
 EXT_URL_ORDINAL_VALUE_STRING = "http://hl7.org/fhir/StructureDefinition/ordinalValue"
 UNKNOWN_QUESTION_STRING = "Unknown Question"
+# Compiled once, since every coding of every flattened observation is classified with these
+LOINC_CODE_PATTERN = re.compile(r"\d+(-\d+)?")
+APPLE_HEALTH_KIT_CODE_PATTERN = re.compile(r"[A-Za-z]+")
 
 
 class KeyNames(Enum):
@@ -475,52 +479,59 @@ class ObservationFlattener(ResourceFlattener):
                 resources.
         """
 
-        flattened_data = []
+        # Collect the data column by column, so the DataFrame is built from one list per
+        # column instead of transposing a list of per-row dictionaries
+        flattened_data = {
+            column: []
+            for column in (
+                ColumnNames.USER_ID.value,
+                ColumnNames.RESOURCE_ID.value,
+                ColumnNames.EFFECTIVE_DATE_TIME.value,
+                ColumnNames.QUANTITY_NAME.value,
+                ColumnNames.LOINC_CODE.value,
+                ColumnNames.DISPLAY.value,
+                ColumnNames.APPLE_HEALTH_KIT_CODE.value,
+                ColumnNames.QUANTITY_UNIT.value,
+                ColumnNames.QUANTITY_VALUE.value,
+            )
+        }
         for observation in resources:
+            # Serialize each resource once; every field below is read from this dict
+            observation_dict = observation.dict()
 
             if not (
-                effective_datetime := observation.dict().get(
+                effective_datetime := observation_dict.get(
                     KeyNames.EFFECTIVE_DATE_TIME.value
                 )
             ):
-                effective_period = observation.dict().get(
+                effective_period = observation_dict.get(
                     KeyNames.EFFECTIVE_PERIOD.value, {}
                 )
                 effective_datetime = effective_period.get(KeyNames.START.value, None)
 
-            coding_info = extract_coding_info(observation)
-            subject_id = "N/A"
-            if observation.subject:
-                subject_id = observation.subject.id
+            value_quantity = observation_dict.get(KeyNames.VALUE_QUANTITY.value, {})
 
-            flattened_entry = {
-                ColumnNames.USER_ID.value: subject_id,
-                ColumnNames.RESOURCE_ID.value: observation.id,
-                ColumnNames.EFFECTIVE_DATE_TIME.value: (
-                    effective_datetime if effective_datetime else None
-                ),
-                **coding_info,
-                ColumnNames.QUANTITY_UNIT.value: observation.dict()
-                .get(KeyNames.VALUE_QUANTITY.value, {})
-                .get(KeyNames.UNIT.value, None),
-                ColumnNames.QUANTITY_VALUE.value: observation.dict()
-                .get(KeyNames.VALUE_QUANTITY.value, {})
-                .get(KeyNames.VALUE.value, None),
-            }
-
-            flattened_data.append(flattened_entry)
+            flattened_data[ColumnNames.USER_ID.value].append(
+                observation.subject.id if observation.subject else "N/A"
+            )
+            flattened_data[ColumnNames.RESOURCE_ID.value].append(observation.id)
+            flattened_data[ColumnNames.EFFECTIVE_DATE_TIME.value].append(
+                effective_datetime if effective_datetime else None
+            )
+            for column, value in extract_coding_info(observation_dict).items():
+                flattened_data[column].append(value)
+            flattened_data[ColumnNames.QUANTITY_UNIT.value].append(
+                value_quantity.get(KeyNames.UNIT.value, None)
+            )
+            flattened_data[ColumnNames.QUANTITY_VALUE.value].append(
+                value_quantity.get(KeyNames.VALUE.value, None)
+            )
 
         flattened_df = pd.DataFrame(flattened_data)
 
         # Convert to UTC, remove timezone info, and then extract the date
-        flattened_df[ColumnNames.EFFECTIVE_DATE_TIME.value] = (
-            pd.to_datetime(
-                flattened_df[ColumnNames.EFFECTIVE_DATE_TIME.value],
-                errors="coerce",
-                utc=True,
-            )
-            .dt.tz_convert(None)
-            .dt.date
+        flattened_df[ColumnNames.EFFECTIVE_DATE_TIME.value] = to_utc_dates(
+            flattened_data[ColumnNames.EFFECTIVE_DATE_TIME.value]
         )
 
         return FHIRDataFrame(flattened_df, FHIRResourceType.OBSERVATION)
@@ -559,19 +570,22 @@ class ECGObservationFlattener(ResourceFlattener):
         """
         flattened_data = []
         for observation in resources:
+            # Serialize each resource once; every field below is read from this dict
+            observation_dict = observation.dict()
 
             if not (
-                effective_datetime := observation.dict().get(
+                effective_datetime := observation_dict.get(
                     KeyNames.EFFECTIVE_DATE_TIME.value
                 )
             ):
-                effective_period = observation.dict().get(
+                effective_period = observation_dict.get(
                     KeyNames.EFFECTIVE_PERIOD.value, {}
                 )
                 effective_datetime = effective_period.get(KeyNames.START.value, None)
 
-            coding_info = extract_coding_info(observation)
-            component_info = extract_component_info(observation)
+            coding_info = extract_coding_info(observation_dict)
+            component_info = extract_component_info(observation_dict)
+            components = observation_dict.get(KeyNames.COMPONENT.value, [{}])
 
             subject_id = "N/A"
             if observation.subject:
@@ -581,27 +595,22 @@ class ECGObservationFlattener(ResourceFlattener):
                 ColumnNames.USER_ID.value: subject_id,
                 ColumnNames.RESOURCE_ID.value: observation.id,
                 ColumnNames.EFFECTIVE_DATE_TIME.value: effective_datetime,
-                ColumnNames.NUMBER_OF_MEASUREMENTS.value: observation.dict()
-                .get(KeyNames.COMPONENT.value, [{}])[0]
+                ColumnNames.NUMBER_OF_MEASUREMENTS.value: components[0]
                 .get(KeyNames.VALUE_QUANTITY.value, {})
                 .get(KeyNames.VALUE.value, None),
-                ColumnNames.SAMPLING_FREQUENCY.value: observation.dict()
-                .get(KeyNames.COMPONENT.value, [{}])[1]
+                ColumnNames.SAMPLING_FREQUENCY.value: components[1]
                 .get(KeyNames.VALUE_QUANTITY.value, {})
                 .get(KeyNames.VALUE.value, None),
-                ColumnNames.SAMPLING_FREQUENCY_UNIT.value: observation.dict()
-                .get(KeyNames.COMPONENT.value, [{}])[1]
+                ColumnNames.SAMPLING_FREQUENCY_UNIT.value: components[1]
                 .get(KeyNames.VALUE_QUANTITY.value, {})
                 .get(KeyNames.UNIT.value, None),
-                ColumnNames.APPLE_ELECTROCARDIOGRAM_CLASSIFICATION.value: observation.dict()
-                .get(KeyNames.COMPONENT.value, [{}])[2]
-                .get(KeyNames.VALUE_STRING.value, None),
-                ColumnNames.HEART_RATE.value: observation.dict()
-                .get(KeyNames.COMPONENT.value, [{}])[3]
+                ColumnNames.APPLE_ELECTROCARDIOGRAM_CLASSIFICATION.value: components[
+                    2
+                ].get(KeyNames.VALUE_STRING.value, None),
+                ColumnNames.HEART_RATE.value: components[3]
                 .get(KeyNames.VALUE_QUANTITY.value, {})
                 .get(KeyNames.VALUE.value, None),
-                ColumnNames.HEART_RATE_UNIT.value: observation.dict()
-                .get(KeyNames.COMPONENT.value, [{}])[3]
+                ColumnNames.HEART_RATE_UNIT.value: components[3]
                 .get(KeyNames.VALUE_QUANTITY.value, {})
                 .get(KeyNames.UNIT.value, None),
                 **coding_info,
@@ -610,34 +619,74 @@ class ECGObservationFlattener(ResourceFlattener):
             flattened_data.append(flattened_entry)
 
         flattened_df = pd.DataFrame(flattened_data)
-        flattened_df[ColumnNames.EFFECTIVE_DATE_TIME.value] = (
-            pd.to_datetime(
-                flattened_df[ColumnNames.EFFECTIVE_DATE_TIME.value],
-                errors="coerce",
-                utc=True,
-            )
-            .dt.tz_convert(None)
-            .dt.date
+        flattened_df[ColumnNames.EFFECTIVE_DATE_TIME.value] = to_utc_dates(
+            flattened_df[ColumnNames.EFFECTIVE_DATE_TIME.value].tolist()
         )
 
         return FHIRDataFrame(flattened_df, FHIRResourceType.ECG_OBSERVATION)
 
 
-def extract_coding_info(observation: Observation | ECGObservation) -> dict:
+def to_utc_dates(values: list[Any]) -> pd.Series:
+    """
+    Converts effective date times into the UTC calendar dates stored in the flattened data.
+
+    The FHIR models already provide `datetime` objects, which are converted one by one; this
+    is considerably faster than handing object columns with UTC offsets to `pd.to_datetime`.
+    If any value is not a `datetime` or `date` (e.g. an ISO 8601 string), all values are
+    parsed with the vectorized `pd.to_datetime` instead. Naive datetimes are treated as UTC,
+    and missing or unparsable values become `NaT`.
+
+    Parameters:
+        values (list[Any]): The effective date times, one per row.
+
+    Returns:
+        pd.Series: The UTC dates as `datetime.date` objects.
+    """
+    dates = []
+    for value in values:
+        if isinstance(value, datetime):
+            dates.append(
+                (value.astimezone(timezone.utc) if value.tzinfo else value).date()
+            )
+        elif value is None:
+            dates.append(pd.NaT)
+        elif isinstance(value, date):
+            dates.append(value)
+        else:
+            # FHIR timestamps are ISO 8601, and naming the format keeps pandas from inferring
+            # it from the first value and coercing timestamps with a different precision or
+            # offset to NaT.
+            return (
+                pd.to_datetime(
+                    pd.Series(values, dtype=object),
+                    errors="coerce",
+                    utc=True,
+                    format="ISO8601",
+                )
+                .dt.tz_convert(None)
+                .dt.date
+            )
+    return pd.Series(dates, dtype=object)
+
+
+def extract_coding_info(observation: Observation | ECGObservation | dict) -> dict:
     """
     Extracts coding information from an Observation resource, focusing on key details
     like LOINC codes and Apple HealthKit codes.
 
     Parameters:
-        observation (Observation | ECGObservation): The FHIR Observation resource from
-            which to extract coding information.
+        observation (Observation | ECGObservation | dict): The FHIR Observation resource, or
+            its already serialized `dict()`, from which to extract coding information.
 
     Returns:
         dict: A dictionary containing extracted coding details such as LOINC code,
             Apple HealthKit code, and display text.
     """
-    coding = (
-        observation.dict().get(KeyNames.CODE.value, {}).get(KeyNames.CODING.value, [])
+    observation_dict = (
+        observation if isinstance(observation, dict) else observation.dict()
+    )
+    coding = observation_dict.get(KeyNames.CODE.value, {}).get(
+        KeyNames.CODING.value, []
     )
 
     loinc_code = None
@@ -656,11 +705,11 @@ def extract_coding_info(observation: Observation | ECGObservation) -> dict:
         code = code_info.get(KeyNames.CODE.value, "")
         display = code_info.get(KeyNames.DISPLAY.value, "")
 
-        if re.fullmatch(r"\d+(-\d+)?", code):
+        if LOINC_CODE_PATTERN.fullmatch(code):
             loinc_code = code
             display_text = display
 
-        elif re.fullmatch(r"[A-Za-z]+", code):
+        elif APPLE_HEALTH_KIT_CODE_PATTERN.fullmatch(code):
             apple_health_kit_code = code
 
     return {
@@ -671,20 +720,24 @@ def extract_coding_info(observation: Observation | ECGObservation) -> dict:
     }
 
 
-def extract_component_info(observation: ECGObservation) -> dict:
+def extract_component_info(observation: ECGObservation | dict) -> dict:
     """
     Extracts information from components of an ECG Observation, relevant for detailed ECG
     data analysis.
 
     Parameters:
-        observation (ECGObservation): The FHIR ECG Observation resource containing component data.
+        observation (ECGObservation | dict): The FHIR ECG Observation resource, or its already
+            serialized `dict()`, containing component data.
 
     Returns:
         dict: A dictionary with structured information extracted from ECG components,
         including a single merged ECG recording data string and the unit of measurement.
     """
     component_info = {}
-    components = observation.dict().get(KeyNames.COMPONENT.value, [])
+    observation_dict = (
+        observation if isinstance(observation, dict) else observation.dict()
+    )
+    components = observation_dict.get(KeyNames.COMPONENT.value, [])
 
     merged_ecg_data = ""
     unit = None
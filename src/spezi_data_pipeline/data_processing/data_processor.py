@@ -105,40 +105,47 @@ class FHIRDataProcessor:  # pylint: disable=unused-variable
             flattened_df[ColumnNames.EFFECTIVE_DATE_TIME.value]
         ).dt.date
 
-        processed_df = pd.DataFrame()
-
-        # Iterate over each group defined by unique combinations of UserID, EffectiveDateTime,
-        # and LOINCCode
-        for _, group_df in flattened_df.groupby(
-            [
-                ColumnNames.USER_ID.value,
-                ColumnNames.EFFECTIVE_DATE_TIME.value,
-                ColumnNames.LOINC_CODE.value,
-            ]
-        ):
-            group_fhir_dataframe = FHIRDataFrame(
-                group_df, flattened_fhir_dataframe.resource_type
-            )
-            filtered_group_df = self.filter_outliers(
-                group_fhir_dataframe,
-                self.code_processor.default_value_ranges.get(
-                    group_df[ColumnNames.LOINC_CODE.value].iloc[0], None
-                ),
-            )
+        # Grouping by UserID and EffectiveDateTime used to drop rows missing either value, so
+        # they are still dropped before processing
+        flattened_df = flattened_df.dropna(
+            subset=[ColumnNames.USER_ID.value, ColumnNames.EFFECTIVE_DATE_TIME.value]
+        )
+
+        processed_groups = []
 
-            process_function = self.code_processor.code_to_function.get(
-                group_df[ColumnNames.LOINC_CODE.value].iloc[0]
+        # Process each LOINC code in one piece. The processing functions already aggregate by
+        # UserID and EffectiveDateTime themselves, so a single groupby per code replaces one
+        # per UserID, EffectiveDateTime, and LOINCCode combination.
+        for loinc_code, code_df in flattened_df.groupby(
+            ColumnNames.LOINC_CODE.value, sort=False
+        ):
+            filtered_code_df = self.filter_outliers(
+                FHIRDataFrame(code_df, flattened_fhir_dataframe.resource_type),
+                self.code_processor.default_value_ranges.get(loinc_code, None),
             )
 
-            if process_function:
-                processed_group_df = process_function(filtered_group_df)
+            if process_function := self.code_processor.code_to_function.get(loinc_code):
+                processed_code_df = process_function(filtered_code_df)
             else:
-                processed_group_df = filtered_group_df
-
-            if isinstance(processed_group_df.df, pd.DataFrame):
-                processed_df = pd.concat(
-                    [processed_df, processed_group_df.df], ignore_index=True
-                )
+                processed_code_df = filtered_code_df
+
+            if isinstance(processed_code_df.df, pd.DataFrame):
+                processed_groups.append(processed_code_df.df)
+
+        # Concatenate once at the end, ordered by UserID, EffectiveDateTime, and LOINCCode
+        processed_df = (
+            pd.concat(processed_groups, ignore_index=True).sort_values(
+                [
+                    ColumnNames.USER_ID.value,
+                    ColumnNames.EFFECTIVE_DATE_TIME.value,
+                    ColumnNames.LOINC_CODE.value,
+                ],
+                kind="stable",
+                ignore_index=True,
+            )
+            if processed_groups
+            else pd.DataFrame()
+        )
 
         if processed_df.empty:
             print("No data was processed.")
@@ -160,8 +167,8 @@ class FHIRDataProcessor:  # pylint: disable=unused-variable
         Parameters:
             flattened_fhir_dataframe (FHIRDataFrame): The FHIRDataFrame to be filtered.
             value_range (tuple[int, int] | None): An optional tuple specifying the inclusive range
-                                                  of acceptable values. If None, default value
-                                                  ranges based on LOINC codes are used.
+                                                  of acceptable values. If None or empty, default
+                                                  value ranges based on LOINC codes are used.
 
         Returns:
             FHIRDataFrame: A filtered FHIRDataFrame with outliers removed.
@@ -181,30 +188,34 @@ class FHIRDataProcessor:  # pylint: disable=unused-variable
             print(f"Validation failed: {str(e)}")
             return None
 
-        # Filter data points based on LOINC code specific value ranges
-        def filter_by_loinc(row):
-            if value_range is not None:
-                # If a global value_range is defined, use it
-                return (
-                    value_range[0]
-                    <= row[ColumnNames.QUANTITY_VALUE.value]
-                    <= value_range[1]
-                )
-            # Otherwise, retrieve the value range specific to the LOINC code
-            loinc_code_range = self.code_processor.default_value_ranges.get(
-                row[ColumnNames.LOINC_CODE.value]
+        # Filter data points based on LOINC code specific value ranges, as one vectorized
+        # mask over the whole frame
+        df = flattened_fhir_dataframe.df
+        if value_range:
+            # If a global value_range is defined, use it
+            lower, upper = value_range
+            keep = df[ColumnNames.QUANTITY_VALUE.value].between(lower, upper)
+        else:
+            # Otherwise, look up the value range specific to each row's LOINC code; rows
+            # whose code has no (or an empty) range are kept
+            codes = df[ColumnNames.LOINC_CODE.value]
+            value_ranges = {
+                code: bounds
+                for code, bounds in self.code_processor.default_value_ranges.items()
+                if bounds
+            }
+            lower = codes.map(
+                {code: bounds[0] for code, bounds in value_ranges.items()}
             )
-            if loinc_code_range:
-                return (
-                    loinc_code_range[0]
-                    <= row[ColumnNames.QUANTITY_VALUE.value]
-                    <= loinc_code_range[1]
-                )
-            return True
+            upper = codes.map(
+                {code: bounds[1] for code, bounds in value_ranges.items()}
+            )
+            keep = (
+                (df[ColumnNames.QUANTITY_VALUE.value] >= lower)
+                & (df[ColumnNames.QUANTITY_VALUE.value] <= upper)
+            ) | lower.isna()
 
-        filtered_df = flattened_fhir_dataframe.df[
-            flattened_fhir_dataframe.df.apply(filter_by_loinc, axis=1)
-        ]
+        filtered_df = df[keep]
 
         return FHIRDataFrame(filtered_df, FHIRResourceType.OBSERVATION)
 
@@ -304,10 +315,16 @@ def select_data_by_dates(  # pylint: disable=unused-variable
     start_datetime = pd.to_datetime(start_date).date()
     end_datetime = pd.to_datetime(end_date).date()
 
-    filtered_df = flattened_fhir_dataframe.df[
-        (flattened_fhir_dataframe.df[date_column] >= start_datetime)
-        & (flattened_fhir_dataframe.df[date_column] <= end_datetime)
-    ]
+    if start_datetime == end_datetime:
+        # A single day needs one equality pass instead of a two-sided range mask.
+        filtered_df = flattened_fhir_dataframe.df[
+            flattened_fhir_dataframe.df[date_column] == start_datetime
+        ]
+    else:
+        filtered_df = flattened_fhir_dataframe.df[
+            (flattened_fhir_dataframe.df[date_column] >= start_datetime)
+            & (flattened_fhir_dataframe.df[date_column] <= end_datetime)
+        ]
 
     return FHIRDataFrame(
         filtered_df.reset_index(drop=True),
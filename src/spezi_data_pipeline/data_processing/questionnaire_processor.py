@@ -31,6 +31,7 @@ Functions:
 
 # Standard library imports
 from enum import Enum
+import warnings
 
 # Related third-party imports
 import pandas as pd
@@ -184,6 +185,32 @@ class SupportedQuestionnaires(Enum):
     WIQ = "WIQ"
 
 
+def _parse_authored_dates(authored_dates: pd.Series) -> pd.Series:
+    """
+    Parse ISO 8601 authored dates. Dates that share one UTC offset keep it, so that each
+    response stays on the local day it was authored. Only a column mixing different offsets is
+    converted to UTC, because pandas can hold it in a single datetime column no other way.
+
+    Parameters:
+    authored_dates (pd.Series): The authored dates as ISO 8601 strings.
+
+    Returns:
+    pd.Series: The parsed authored dates.
+    """
+    with warnings.catch_warnings():
+        # Before pandas 3.0, mixed offsets give an object column and a FutureWarning
+        # instead of an error
+        warnings.simplefilter("ignore", FutureWarning)
+        try:
+            parsed = pd.to_datetime(authored_dates, format="ISO8601")
+        except ValueError:
+            parsed = None
+
+    if parsed is not None and pd.api.types.is_datetime64_any_dtype(parsed):
+        return parsed
+    return pd.to_datetime(authored_dates, format="ISO8601", utc=True)
+
+
 def calculate_aggregated_score(
     fhir_dataframe: FHIRDataFrame, severity_enum: Enum
 ) -> FHIRDataFrame:
@@ -205,8 +232,10 @@ def calculate_aggregated_score(
             ColumnNames.ANSWER_CODE.value
         ].astype(int)
 
-    if fhir_dataframe.df[ColumnNames.AUTHORED_DATE.value].dtype == OBJECT:
-        fhir_dataframe.df[ColumnNames.AUTHORED_DATE.value] = pd.to_datetime(
+    if not pd.api.types.is_datetime64_any_dtype(
+        fhir_dataframe.df[ColumnNames.AUTHORED_DATE.value]
+    ):
+        fhir_dataframe.df[ColumnNames.AUTHORED_DATE.value] = _parse_authored_dates(
             fhir_dataframe.df[ColumnNames.AUTHORED_DATE.value]
         )
 
@@ -284,8 +313,10 @@ def calculate_wiq_score(
             ColumnNames.ANSWER_CODE.value
         ].astype(int)
 
-    if fhir_dataframe.df[ColumnNames.AUTHORED_DATE.value].dtype == OBJECT:
-        fhir_dataframe.df[ColumnNames.AUTHORED_DATE.value] = pd.to_datetime(
+    if not pd.api.types.is_datetime64_any_dtype(
+        fhir_dataframe.df[ColumnNames.AUTHORED_DATE.value]
+    ):
+        fhir_dataframe.df[ColumnNames.AUTHORED_DATE.value] = _parse_authored_dates(
             fhir_dataframe.df[ColumnNames.AUTHORED_DATE.value]
         )
 
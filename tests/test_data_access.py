@@ -46,7 +46,9 @@ GCLOUD_PROJECT_STRING = "GCLOUD_PROJECT"
 ECG_RECORDING_LOINC_CODE = "131328"
 
 
-class TestFirebaseFHIRAccess(unittest.TestCase):  # pylint: disable=unused-variable
+class TestFirebaseFHIRAccess(
+    unittest.TestCase
+):  # pylint: disable=unused-variable, too-many-public-methods
     """
     Unit tests for the FirebaseFHIRAccess class.
 
@@ -61,6 +63,30 @@ class TestFirebaseFHIRAccess(unittest.TestCase):  # pylint: disable=unused-varia
         self.project_id = "test-project"
         self.service_account_key_file = "/path/to/service/account.json"
         self.mock_db = MagicMock()
+        self.firebase_access = FirebaseFHIRAccess(self.project_id)
+        self.firebase_access.db = self.mock_db
+
+        file_path = "sample_data/XrftRMc358NndzcRWEQ7P2MxvabZ_sample_data1.json"
+        with open(file_path, "r", encoding="utf-8") as file:
+            self.sample_data = json.load(file)
+
+    @staticmethod
+    def record_parse(events: list[str]):
+        """Creates a `create_resources` stand-in that records how many documents it parsed."""
+
+        def parse_docs(fhir_docs, user):  # pylint: disable=unused-argument
+            fhir_docs = list(fhir_docs)
+            events.append(f"parsed {len(fhir_docs)}")
+            return [object() for _ in fhir_docs]
+
+        return parse_docs
+
+    def sample_docs(self, count: int) -> list[MagicMock]:
+        """Creates `count` Firestore document mocks holding the sample observation."""
+        docs = [MagicMock() for _ in range(count)]
+        for doc in docs:
+            doc.to_dict.return_value = dict(self.sample_data)
+        return docs
 
     @patch("os.path.exists")
     @patch("os.environ")
@@ -170,7 +196,7 @@ class TestFirebaseFHIRAccess(unittest.TestCase):  # pylint: disable=unused-varia
         mock_db.collection.return_value = mock_collection
         mock_user_doc = MagicMock()
         mock_user_stream = iter([mock_user_doc])
-        mock_collection.stream.return_value = mock_user_stream
+        mock_collection.select.return_value.stream.return_value = mock_user_stream
         mock_subcollection = MagicMock()
         mock_user_doc.collection.return_value = mock_subcollection
         mock_subcollection.stream.return_value = iter([])
@@ -191,11 +217,11 @@ class TestFirebaseFHIRAccess(unittest.TestCase):  # pylint: disable=unused-varia
 
         mock_collection = MagicMock()
         mock_db.collection.return_value = mock_collection
-        mock_collection.stream.return_value = iter([])
+        mock_collection.select.return_value.stream.return_value = iter([])
 
         firebase_access.fetch_data("users", "HealthKit")
 
-        mock_collection.stream.assert_called_once_with(
+        mock_collection.select.return_value.stream.assert_called_once_with(
             timeout=FirebaseFHIRAccess.DEFAULT_TIMEOUT
         )
 
@@ -208,11 +234,12 @@ class TestFirebaseFHIRAccess(unittest.TestCase):  # pylint: disable=unused-varia
 
         mock_collection = MagicMock()
         mock_db.collection.return_value = mock_collection
-        mock_collection.stream.return_value = iter([])
+        mock_collection.select.return_value.stream.return_value = iter([])
 
         firebase_access.fetch_data("users", "HealthKit")
 
-        mock_collection.stream.assert_called_once_with(timeout=600)
+        mock_collection.select.assert_called_once_with(["__name__"])
+        mock_collection.select.return_value.stream.assert_called_once_with(timeout=600)
 
     @patch("firebase_admin.firestore")
     def test_fetch_data_passes_timeout_to_subcollection_stream(self, mock_firestore):
@@ -224,7 +251,7 @@ class TestFirebaseFHIRAccess(unittest.TestCase):  # pylint: disable=unused-varia
         mock_collection = MagicMock()
         mock_db.collection.return_value = mock_collection
         mock_user_doc = MagicMock()
-        mock_collection.stream.return_value = iter([mock_user_doc])
+        mock_collection.select.return_value.stream.return_value = iter([mock_user_doc])
 
         mock_subcollection = MagicMock()
         mock_collection.document.return_value.collection.return_value = (
@@ -236,6 +263,40 @@ class TestFirebaseFHIRAccess(unittest.TestCase):  # pylint: disable=unused-varia
 
         mock_subcollection.stream.assert_called_once_with(timeout=120)
 
+    @patch("firebase_admin.firestore")
+    def test_fetch_data_filters_subcollection_by_date(self, mock_firestore):
+        mock_db = MagicMock()
+        mock_firestore.client.return_value = mock_db
+        firebase_access = FirebaseFHIRAccess(self.project_id)
+        firebase_access.db = mock_db
+
+        mock_collection = MagicMock()
+        mock_db.collection.return_value = mock_collection
+        mock_collection.select.return_value.stream.return_value = iter([MagicMock()])
+
+        mock_subcollection = MagicMock()
+        mock_collection.document.return_value.collection.return_value = (
+            mock_subcollection
+        )
+        mock_filtered = mock_subcollection.where.return_value.where.return_value
+        mock_filtered.stream.return_value = iter([])
+
+        firebase_access.fetch_data(
+            "users",
+            "HealthKit",
+            index_name="effectiveDateTime",
+            start_date="2024-01-01",
+            end_date="2024-01-31",
+        )
+
+        mock_subcollection.where.assert_called_once_with(
+            "effectiveDateTime", ">=", "2024-01-01"
+        )
+        mock_subcollection.where.return_value.where.assert_called_once_with(
+            "effectiveDateTime", "<=", "2024-01-31"
+        )
+        mock_filtered.stream.assert_called_once()
+
     @patch("firebase_admin.firestore")
     def test_fetch_data_path_passes_timeout_to_stream(self, mock_firestore):
         mock_db = MagicMock()
@@ -251,6 +312,190 @@ class TestFirebaseFHIRAccess(unittest.TestCase):  # pylint: disable=unused-varia
 
         mock_collection.stream.assert_called_once_with(timeout=450)
 
+    def test_fetch_data_path_reads_pages_with_cursors(self):
+        docs = self.sample_docs(3)
+
+        mock_collection = MagicMock()
+        self.mock_db.collection.return_value = mock_collection
+        first_page = mock_collection.limit.return_value
+        second_page = first_page.start_after.return_value
+        first_page.stream.return_value = iter(docs[:2])
+        second_page.stream.return_value = iter(docs[2:])
+
+        resources = self.firebase_access.fetch_data_path(
+            "users/uid/HealthKit", page_size=2
+        )
+
+        self.assertEqual(len(resources), 3)
+        mock_collection.limit.assert_called_with(2)
+        first_page.start_after.assert_called_once_with(docs[1])
+        mock_collection.stream.assert_not_called()
+
+    def test_fetch_data_path_stops_after_empty_last_page(self):
+        docs = self.sample_docs(4)
+
+        mock_collection = MagicMock()
+        self.mock_db.collection.return_value = mock_collection
+        first_page = mock_collection.limit.return_value
+        next_page = first_page.start_after.return_value
+        first_page.stream.return_value = iter(docs[:2])
+        # The last page holds exactly page_size documents, so one more empty page is read
+        next_page.stream.side_effect = [iter(docs[2:]), iter([])]
+
+        resources = self.firebase_access.fetch_data_path(
+            "users/uid/HealthKit", page_size=2
+        )
+
+        self.assertEqual(len(resources), 4)
+        self.assertEqual(next_page.stream.call_count, 2)
+        self.assertEqual(
+            [call.args for call in first_page.start_after.call_args_list],
+            [(docs[1],), (docs[3],)],
+        )
+
+    def test_fetch_data_path_rejects_non_positive_page_size(self):
+        for page_size in (0, -1):
+            with self.assertRaises(ValueError):
+                self.firebase_access.fetch_data_path(
+                    "users/uid/HealthKit", page_size=page_size
+                )
+        self.mock_db.collection.assert_not_called()
+
+    def test_fetch_data_path_drains_stream_before_parsing(self):
+        docs = self.sample_docs(3)
+        events = []
+
+        def stream_docs():
+            yield from docs
+            events.append("read")
+
+        mock_collection = MagicMock()
+        self.mock_db.collection.return_value = mock_collection
+        mock_collection.stream.return_value = stream_docs()
+
+        with patch.object(
+            ObservationCreator,
+            "create_resources",
+            side_effect=self.record_parse(events),
+        ):
+            resources = self.firebase_access.fetch_data_path("users/uid/HealthKit")
+
+        self.assertEqual(len(resources), 3)
+        self.assertEqual(events, ["read", "parsed 3"])
+
+    def test_fetch_data_path_parses_each_page_after_reading_it(self):
+        docs = self.sample_docs(3)
+        events = []
+
+        def stream_page(page_docs):
+            yield from page_docs
+            events.append("read")
+
+        mock_collection = MagicMock()
+        self.mock_db.collection.return_value = mock_collection
+        first_page = mock_collection.limit.return_value
+        first_page.stream.return_value = stream_page(docs[:2])
+        first_page.start_after.return_value.stream.return_value = stream_page(docs[2:])
+
+        with patch.object(
+            ObservationCreator,
+            "create_resources",
+            side_effect=self.record_parse(events),
+        ):
+            resources = self.firebase_access.fetch_data_path(
+                "users/uid/HealthKit", page_size=2
+            )
+
+        self.assertEqual(len(resources), 3)
+        self.assertEqual(events, ["read", "parsed 2", "read", "parsed 1"])
+
+    @patch("firebase_admin.firestore")
+    def test_fetch_data_queries_all_loinc_codes_at_once(self, mock_firestore):
+        mock_db = MagicMock()
+        mock_firestore.client.return_value = mock_db
+        firebase_access = FirebaseFHIRAccess(self.project_id)
+        firebase_access.db = mock_db
+
+        mock_collection = MagicMock()
+        mock_db.collection.return_value = mock_collection
+        mock_collection.select.return_value.stream.return_value = iter([MagicMock()])
+        mock_subcollection = MagicMock()
+        mock_collection.document.return_value.collection.return_value = (
+            mock_subcollection
+        )
+        mock_subcollection.where.return_value.stream.return_value = iter([])
+
+        firebase_access.fetch_data("users", "HealthKit", ["55423-8", "8867-4"])
+
+        mock_subcollection.where.assert_called_once()
+        code_filter = mock_subcollection.where.call_args.kwargs["filter"]
+        self.assertEqual(code_filter.op_string, "array_contains_any")
+        self.assertEqual(
+            [coding["code"] for coding in code_filter.value], ["55423-8", "8867-4"]
+        )
+
+    def test_fetch_data_keeps_user_order_across_workers(self):
+        user_ids = [f"user{index}" for index in range(8)]
+        user_documents = {}
+        for user_id, doc in zip(user_ids, self.sample_docs(len(user_ids))):
+            user_document = MagicMock()
+            user_document.collection.return_value.stream.return_value = iter([doc])
+            user_documents[user_id] = user_document
+
+        mock_collection = MagicMock()
+        self.mock_db.collection.return_value = mock_collection
+        mock_collection.select.return_value.stream.return_value = iter(
+            [MagicMock(id=user_id) for user_id in user_ids]
+        )
+        mock_collection.document.side_effect = user_documents.__getitem__
+
+        resources = self.firebase_access.fetch_data("users", "HealthKit", max_workers=4)
+
+        self.assertEqual([resource.subject.id for resource in resources], user_ids)
+
+    @patch("firebase_admin.firestore")
+    def test_fetch_data_path_sends_duplicate_codes_once(self, mock_firestore):
+        mock_db = MagicMock()
+        mock_firestore.client.return_value = mock_db
+        firebase_access = FirebaseFHIRAccess(self.project_id)
+        firebase_access.db = mock_db
+
+        mock_collection = MagicMock()
+        mock_db.collection.return_value = mock_collection
+        mock_collection.where.return_value.stream.return_value = iter([])
+
+        firebase_access.fetch_data_path(
+            "users/uid/HealthKit", ["8867-4", "55423-8", "8867-4"]
+        )
+
+        code_filter = mock_collection.where.call_args.kwargs["filter"]
+        self.assertEqual(
+            [coding["code"] for coding in code_filter.value], ["8867-4", "55423-8"]
+        )
+
+    def test_fetch_data_collection_group_groups_by_user(self):
+        user_refs = [MagicMock(id="user1"), MagicMock(id="user2")]
+        docs = self.sample_docs(3)
+        for doc, user_ref in zip(docs, (user_refs[0], user_refs[1], user_refs[0])):
+            doc.reference.parent.parent = user_ref
+
+        mock_group = MagicMock()
+        self.mock_db.collection_group.return_value = mock_group
+        mock_group.where.return_value.stream.return_value = iter(docs)
+
+        resources = self.firebase_access.fetch_data_collection_group(
+            "HealthKit", loinc_codes=["55423-8"]
+        )
+
+        self.mock_db.collection_group.assert_called_once_with("HealthKit")
+        self.mock_db.collection.assert_not_called()
+        mock_group.where.return_value.stream.assert_called_once_with(timeout=300)
+        self.assertEqual(len(resources), 3)
+        self.assertEqual(
+            sorted(resource.subject.id for resource in resources),
+            ["user1", "user1", "user2"],
+        )
+
 
 class TestObservationCreator(unittest.TestCase):  # pylint: disable=unused-variable
     """
@@ -25,6 +25,7 @@ Classes:
     `TestQuestionnaireResponseExplorerExplorer`: Contains all the unit tests for testing the
                                                  `QuestionnaireResponseExplorer` functionalities.
     `TestECGExplorer`: Contains all the unit tests for testing the `ECGExplorer` functionalities.
+    `TestLTTB`: Contains the unit tests for the LTTB downsampling of ECG waveforms.
 """
 
 # Standard library imports
@@ -34,8 +35,10 @@ from datetime import datetime
 # Related third-party imports
 import unittest
 from unittest.mock import patch, MagicMock
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import pytest
 
 # Local application/library specific imports
 from spezi_data_pipeline.data_flattening.fhir_resources_flattener import (
@@ -43,11 +46,14 @@ from spezi_data_pipeline.data_flattening.fhir_resources_flattener import (
     FHIRDataFrame,
     ColumnNames,
 )
-from spezi_data_pipeline.data_exploration.data_explorer import (
+from spezi_data_pipeline.data_exploration.data_explorer import (  # pylint: disable=import-private-name
     DataExplorer,
     ECGExplorer,
     QuestionnaireResponseExplorer,
     explore_total_records_number,
+    visualizer_factory,
+    _lttb,
+    _lttb_indices,
 )
 
 USER_ID1 = "user1"
@@ -75,6 +81,14 @@ class TestDataExplorer(unittest.TestCase):  # pylint: disable=unused-variable
         self.assertEqual(visualizer.start_date.strftime("%Y-%m-%d"), start_date)
         self.assertEqual(visualizer.end_date.strftime("%Y-%m-%d"), end_date)
 
+    def test_set_date_range_accepts_unpadded_dates(self):
+        """Test that dates without zero padding are still accepted, as by `strptime`."""
+        explorer = DataExplorer()
+        explorer.set_date_range("2024-1-5", "2024-2-9")
+
+        self.assertEqual(explorer.start_date, datetime(2024, 1, 5).date())
+        self.assertEqual(explorer.end_date, datetime(2024, 2, 9).date())
+
     def test_set_user_ids(self):
         """
         Test setting the user IDs for data exploration.
@@ -125,6 +139,114 @@ class TestDataExplorer(unittest.TestCase):  # pylint: disable=unused-variable
         mock_plot_combined.assert_called_once()
         mock_plot_individual.assert_not_called()
 
+    @patch("matplotlib.pyplot.show")
+    def test_create_static_plot_individual(
+        self, mock_show
+    ):  # pylint: disable=unused-argument
+        """
+        Test creating individual static plots.
+
+        Verifies that when the 'combine_plots' flag is False, one figure is created for every
+        requested user that has data, and users without data are skipped.
+        """
+        visualizer = DataExplorer()
+        visualizer.set_combine_plots(False)
+        visualizer.set_user_ids(
+            ["XrftRMc358NndzcRWEQ7P2MxvabZ", "sEmijWpn0vXe1cj60GO5kkjkrdT4", "user3"]
+        )
+
+        data_file = Path(__file__).parent.parent / "sample_data" / "sample_df.csv"
+        df = pd.read_csv(data_file)
+        mock_fhir_df = MagicMock()
+        mock_fhir_df.df = df
+
+        figs = visualizer.create_static_plot(mock_fhir_df)
+        self.assertEqual(len(figs), 2)
+        self.assertTrue(all(isinstance(fig, plt.Figure) for fig in figs))
+
+    @patch(
+        "spezi_data_pipeline.data_exploration.data_explorer.DataExplorer.plot_individual"
+    )
+    def test_create_static_plot_passes_user_frames(self, mock_plot_individual):
+        """
+        Test that 'plot_individual' receives only the data of the user it plots, so it does
+        not have to filter the LOINC code's data again.
+        """
+        visualizer = DataExplorer()
+        visualizer.set_combine_plots(False)
+        visualizer.set_user_ids(
+            ["XrftRMc358NndzcRWEQ7P2MxvabZ", "sEmijWpn0vXe1cj60GO5kkjkrdT4"]
+        )
+
+        data_file = Path(__file__).parent.parent / "sample_data" / "sample_df.csv"
+        mock_fhir_df = MagicMock()
+        mock_fhir_df.df = pd.read_csv(data_file)
+
+        visualizer.create_static_plot(mock_fhir_df)
+
+        self.assertTrue(mock_plot_individual.called)
+        for (user_df, user_id, _), _ in mock_plot_individual.call_args_list:
+            self.assertTrue((user_df[ColumnNames.USER_ID.value] == user_id).all())
+
+    @patch("matplotlib.pyplot.show")
+    def test_plot_combined_scatter_users(
+        self, mock_show
+    ):  # pylint: disable=unused-argument
+        """
+        Test that users with duplicate timestamps share a single scatter collection while
+        keeping one legend entry per user.
+        """
+        df = pd.DataFrame(
+            {
+                ColumnNames.USER_ID.value: ["user1", "user1", "user2", "user2"],
+                ColumnNames.EFFECTIVE_DATE_TIME.value: pd.to_datetime(
+                    ["2023-01-01", "2023-01-01", "2023-01-02", "2023-01-02"]
+                ),
+                ColumnNames.QUANTITY_VALUE.value: [1, 2, 3, 4],
+                ColumnNames.QUANTITY_NAME.value: ["Step Count"] * 4,
+                ColumnNames.QUANTITY_UNIT.value: ["steps"] * 4,
+            }
+        )
+
+        fig = DataExplorer().plot_combined(df, ["user1", "user2"], "55423-8")
+
+        ax = fig.axes[0]
+        self.assertEqual(len(ax.collections), 1)
+        self.assertEqual(len(ax.collections[0].get_offsets()), 4)
+        self.assertEqual(
+            [text.get_text() for text in ax.get_legend().get_texts()],
+            ["User user1", "User user2"],
+        )
+
+    @patch("matplotlib.pyplot.subplots")
+    def test_plot_combined_without_user_data(self, mock_subplots):
+        """
+        Test that no figure is created when none of the requested users has data.
+        """
+        data_file = Path(__file__).parent.parent / "sample_data" / "sample_df.csv"
+        df = pd.read_csv(data_file)
+
+        fig = DataExplorer().plot_combined(df, ["user3"], "55423-8")
+
+        self.assertIsNone(fig)
+        mock_subplots.assert_not_called()
+
+    @patch("matplotlib.pyplot.show")
+    def test_create_static_plot_without_showing(self, mock_show):
+        """
+        Test that disabling 'show_plots' still returns the figures without displaying them.
+        """
+        visualizer = DataExplorer()
+        visualizer.set_show_plots(False)
+
+        data_file = Path(__file__).parent.parent / "sample_data" / "sample_df.csv"
+        mock_fhir_df = MagicMock()
+        mock_fhir_df.df = pd.read_csv(data_file)
+
+        figs = visualizer.create_static_plot(mock_fhir_df)
+        self.assertTrue(figs)
+        mock_show.assert_not_called()
+
 
 class TestECGExplorer(unittest.TestCase):  # pylint: disable=unused-variable
     """
@@ -183,6 +305,51 @@ class TestECGExplorer(unittest.TestCase):  # pylint: disable=unused-variable
         else:
             self.assertEqual(len(figs), 0)
 
+    def test_plot_single_user_ecg_units(self):
+        """Test that mV recordings are plotted as-is and uV recordings are scaled to mV."""
+        user_data = self.fhir_dataframe.df.iloc[:2].copy()
+        user_data[ColumnNames.ECG_RECORDING_UNIT.value] = ["mV", "uV"]
+
+        figs = self.explorer.plot_single_user_ecg(user_data, USER_ID1)
+
+        self.assertEqual(len(figs), 2)
+        self.assertEqual(figs[0].axes[0].lines[0].get_ydata()[0], 1.0)
+        self.assertAlmostEqual(figs[1].axes[0].lines[0].get_ydata()[0], 0.004)
+
+    def test_plot_single_user_ecg_invalid_unit(self):
+        """Test that an unsupported unit stops plotting without leaving a figure open."""
+        user_data = self.fhir_dataframe.df.iloc[:2].copy()
+        user_data[ColumnNames.ECG_RECORDING_UNIT.value] = ["mV", "V"]
+        open_figures = plt.get_fignums()
+
+        figs = self.explorer.plot_single_user_ecg(user_data, USER_ID1)
+
+        self.assertEqual(len(figs), 1)
+        self.assertEqual(plt.get_fignums(), open_figures)
+
+    def test_plot_single_user_ecg_downsample(self):
+        """Test that long recordings are downsampled only while downsampling is enabled."""
+        user_data = self.fhir_dataframe.df.iloc[:1].copy()
+        user_data[ColumnNames.ECG_RECORDING.value] = " ".join(["0.1"] * 30000)
+
+        fig = self.explorer.plot_single_user_ecg(user_data, USER_ID1)[0]
+        self.assertLess(len(fig.axes[0].lines[0].get_xdata()), 10000)
+
+        self.explorer.set_downsample(False)
+        fig = self.explorer.plot_single_user_ecg(user_data, USER_ID1)[0]
+        self.assertEqual(len(fig.axes[0].lines[0].get_xdata()), 10000)
+
+    def test_parsed_recordings_cached_per_explorer(self):
+        """Test that parsed recordings are reused by one explorer but not shared with others."""
+        user_data = self.fhir_dataframe.df.iloc[:1]
+        # pylint: disable=protected-access
+        self.explorer.plot_single_user_ecg(user_data, USER_ID1)
+        self.explorer.plot_single_user_ecg(user_data, USER_ID1)
+        self.assertEqual(self.explorer._parse_recording.cache_info().hits, 1)
+
+        other_explorer = ECGExplorer()
+        self.assertEqual(other_explorer._parse_recording.cache_info().currsize, 0)
+
     def test_no_ecg_data(self):
         self.explorer.set_date_range("2024-01-01", "2024-01-31")
         self.explorer.set_user_ids(["user3"])
@@ -191,6 +358,53 @@ class TestECGExplorer(unittest.TestCase):  # pylint: disable=unused-variable
         self.assertEqual(figs, [])
 
 
+class TestLTTB(unittest.TestCase):  # pylint: disable=unused-variable
+    """
+    Test suite for the Largest-Triangle-Three-Buckets downsampling of ECG waveforms.
+
+    The selection kernel is compiled with Numba when it is installed, so the pure-Python
+    kernel is tested directly and, if Numba is available, compared with its compiled form.
+    """
+
+    def setUp(self):
+        # With Numba installed the module exposes the compiled kernel; `py_func` is the
+        # original Python function.
+        self.py_kernel = getattr(_lttb_indices, "py_func", _lttb_indices)
+
+    def test_python_kernel_keeps_extremes(self):
+        """Test that the pure-Python kernel keeps the peak and trough of each bucket."""
+        x = np.arange(7, dtype=np.float64)
+        y = np.array([0, 0, 5, 0, 0, -3, 0], dtype=np.float64)
+        edges = np.array([1, 3, 6, 7], dtype=np.intp)
+
+        selected = self.py_kernel(x, y, edges)
+
+        self.assertEqual(selected.tolist(), [0, 2, 5, 6])
+
+    def test_lttb_keeps_first_and_last_points(self):
+        """Test that downsampling keeps the requested number of points and both end points."""
+        x = np.arange(1000, dtype=np.float64)
+        y = np.sin(x / 10)
+
+        x_out, y_out = _lttb(x, y, 50)
+
+        self.assertEqual(len(x_out), 50)
+        self.assertEqual((x_out[0], x_out[-1]), (x[0], x[-1]))
+        self.assertEqual((y_out[0], y_out[-1]), (y[0], y[-1]))
+
+    def test_numba_kernel_matches_python_kernel(self):
+        """Test that the Numba-compiled kernel selects the same indices as the Python one."""
+        numba = pytest.importorskip("numba")
+        rng = np.random.default_rng(0)
+        x = np.arange(5000, dtype=np.float64)
+        y = rng.standard_normal(5000)
+        edges = np.append(np.linspace(1, 4999, 200).astype(np.intp), 5000)
+
+        np.testing.assert_array_equal(
+            numba.njit(self.py_kernel)(x, y, edges), self.py_kernel(x, y, edges)
+        )
+
+
 class TestQuestionnaireResponseExplorer(
     unittest.TestCase
 ):  # pylint: disable=unused-variable
@@ -326,6 +540,54 @@ class TestExploreTotalRecordsNumber(
         )  # Since bars are stacked, divide by num_unique_loinc_codes
         self.assertEqual(num_bars, num_unique_loinc_codes)
 
+    @patch("matplotlib.pyplot.show")
+    def test_explore_total_records_number_keeps_input(self, mock_show):
+        dates = ["2023-01-01", "2023-01-02", "2023-01-03"]
+        df = pd.DataFrame(
+            {
+                ColumnNames.EFFECTIVE_DATE_TIME.value: dates,
+                ColumnNames.USER_ID.value: ["user1", "user2", "user1"],
+                ColumnNames.LOINC_CODE.value: ["code1", "code1", "code2"],
+            }
+        )
+
+        ax = explore_total_records_number(
+            df, start_date="2023-01-02", end_date="2023-01-31"
+        )
+
+        mock_show.assert_called_once()
+        self.assertEqual(len(ax.patches), 4)
+        self.assertEqual(df[ColumnNames.EFFECTIVE_DATE_TIME.value].tolist(), dates)
+
+
+class TestVisualizerFactory(unittest.TestCase):  # pylint: disable=unused-variable
+    """
+    Test the visualizer_factory function.
+
+    The tests include:
+    - Returning a fresh explorer of the matching class for each resource type.
+    - Raising a ValueError for a QuestionnaireResponse without a questionnaire title.
+    """
+
+    def test_explorer_per_resource_type(self):
+        """Test that each call returns a new explorer of the matching class."""
+        fhir_df = MagicMock(resource_type=FHIRResourceType.ECG_OBSERVATION)
+        explorer = visualizer_factory(fhir_df)
+
+        self.assertIsInstance(explorer, ECGExplorer)
+        self.assertIsNot(explorer, visualizer_factory(fhir_df))
+
+        fhir_df.resource_type = FHIRResourceType.QUESTIONNAIRE_RESPONSE
+        self.assertIsInstance(
+            visualizer_factory(fhir_df, "PHQ-9"), QuestionnaireResponseExplorer
+        )
+
+    def test_missing_questionnaire_title(self):
+        """Test that a QuestionnaireResponse without a title raises a ValueError."""
+        fhir_df = MagicMock(resource_type=FHIRResourceType.QUESTIONNAIRE_RESPONSE)
+        with self.assertRaises(ValueError):
+            visualizer_factory(fhir_df)
+
 
 if __name__ == "__main__":
     unittest.main()
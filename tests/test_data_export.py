@@ -29,6 +29,7 @@ Classes:
 """
 
 # Standard library imports
+from datetime import date
 from pathlib import Path
 
 # Related third-party imports
@@ -38,9 +39,12 @@ import pandas as pd
 
 # Local application/library specific imports
 from spezi_data_pipeline.data_flattening.fhir_resources_flattener import (
+    ColumnNames,
     FHIRDataFrame,
     FHIRResourceType,
 )
+from spezi_data_pipeline.data_exploration import data_explorer
+from spezi_data_pipeline.data_exploration.data_explorer import DEFAULT_TIME_TICKS
 from spezi_data_pipeline.data_export.data_exporter import DataExporter
 
 
@@ -76,6 +80,15 @@ class TestDataExporter(unittest.TestCase):  # pylint: disable=unused-variable
             ["XrftRMc358NndzcRWEQ7P2MxvabZ", "sEmijWpn0vXe1cj60GO5kkjkrdT4"],
         )
 
+    def test_initialization_ecg_settings(self):
+        """
+        This test checks that the exporter also carries the ECG plot settings, so ECG data can
+        be exported without configuring them by hand.
+        """
+        self.assertEqual(self.exporter.time_ticks, DEFAULT_TIME_TICKS)
+        self.assertTrue(self.exporter.downsample)
+        self.assertTrue(self.exporter.show_plots)
+
     @patch("pandas.DataFrame.to_csv")
     def test_export_to_csv(self, mock_to_csv):
         """
@@ -108,6 +121,70 @@ class TestDataExporter(unittest.TestCase):  # pylint: disable=unused-variable
         else:
             mock_savefig.assert_not_called()
 
+    @patch("matplotlib.pyplot.show")
+    @patch("matplotlib.figure.Figure.savefig")
+    def test_create_and_save_plot_does_not_show(self, mock_savefig, mock_show):
+        """
+        This test checks that saving plots in a batch export only writes the figures and never
+        displays them.
+        """
+        self.exporter.create_and_save_plot("plot_base")
+        mock_savefig.assert_called()
+        mock_show.assert_not_called()
+
+    @patch(
+        "spezi_data_pipeline.data_exploration.data_explorer._lttb",
+        wraps=data_explorer._lttb,  # pylint: disable=protected-access
+    )
+    @patch("matplotlib.figure.Figure.savefig")
+    def test_create_and_save_ecg_plot_keeps_all_samples(self, mock_savefig, mock_lttb):
+        """
+        This test checks that exported ECG plots are drawn from every recorded sample instead of
+        the downsampled waveform used for on-screen figures.
+        """
+        recording = " ".join(["0.1", "0.5", "-0.2"] * 4000)
+        df = pd.DataFrame(
+            {
+                ColumnNames.USER_ID.value: ["user1"],
+                ColumnNames.EFFECTIVE_DATE_TIME.value: [date(2023, 1, 1)],
+                ColumnNames.ECG_RECORDING.value: [recording],
+                ColumnNames.ECG_RECORDING_UNIT.value: ["mV"],
+                ColumnNames.SAMPLING_FREQUENCY.value: [512],
+            }
+        )
+        exporter = DataExporter(FHIRDataFrame(df, FHIRResourceType.ECG_OBSERVATION))
+        exporter.set_user_ids(["user1"])
+
+        exporter.create_and_save_plot("ecg_base")
+
+        mock_savefig.assert_called_once()
+        self.assertFalse(mock_lttb.called)
+
+    @patch("matplotlib.figure.Figure.savefig", autospec=True)
+    def test_create_and_save_ecg_plot_uses_one_dpi(self, mock_savefig):
+        """
+        This test checks that exported ECG figures are drawn and saved at the DPI configured on
+        the exporter.
+        """
+        df = pd.DataFrame(
+            {
+                ColumnNames.USER_ID.value: ["user1"],
+                ColumnNames.EFFECTIVE_DATE_TIME.value: [date(2023, 1, 1)],
+                ColumnNames.ECG_RECORDING.value: [" ".join(["0.1", "0.5"] * 100)],
+                ColumnNames.ECG_RECORDING_UNIT.value: ["mV"],
+                ColumnNames.SAMPLING_FREQUENCY.value: [512],
+            }
+        )
+        exporter = DataExporter(FHIRDataFrame(df, FHIRResourceType.ECG_OBSERVATION))
+        exporter.set_user_ids(["user1"])
+        exporter.set_dpi_ecg(150)
+
+        exporter.create_and_save_plot("ecg_base")
+
+        fig = mock_savefig.call_args.args[0]
+        self.assertEqual(fig.dpi, 150)
+        self.assertEqual(mock_savefig.call_args.kwargs["dpi"], "figure")
+
 
 if __name__ == "__main__":
     unittest.main()
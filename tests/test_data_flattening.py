@@ -28,6 +28,7 @@ Classes:
 """
 
 # Standard library imports
+from datetime import date, datetime, timedelta, timezone
 import json
 from pathlib import Path
 
@@ -55,10 +56,12 @@ from spezi_data_pipeline.data_flattening.fhir_resources_flattener import (
     ObservationFlattener,
     ECGObservationFlattener,
     QuestionnaireResponseFlattener,
+    extract_coding_info,
     extract_questionnaire_mappings,
     flatten_fhir_resources,
     get_answer_code_and_value,
     get_questionnaire_title,
+    to_utc_dates,
 )
 
 # pylint: enable=duplicate-code
@@ -131,6 +134,92 @@ class TestObservationFlattener(unittest.TestCase):  # pylint: disable=unused-var
         self.assertEqual(len(result.df), 2)
         self.assertTrue(ColumnNames.USER_ID.value in result.df.columns)
 
+    def test_flatten_no_observations(self):
+        """
+        Ensures that flattening an empty list of Observations yields an empty `DataFrame` that
+        still has the Observation columns.
+        """
+        result = ObservationFlattener().flatten([])
+
+        self.assertTrue(result.df.empty)
+        self.assertTrue(result.validate_columns())
+
+    def test_flatten_mixed_precision_timestamps(self):
+        """
+        Ensures that ISO 8601 timestamps with and without fractional seconds are all parsed,
+        rather than coercing those that differ from the first value to missing dates.
+        """
+        resources = []
+        for timestamp in ("2024-01-02T03:04:05Z", "2024-01-03T03:04:05.123Z"):
+            observation = MagicMock()
+            observation.dict.return_value = {"effectiveDateTime": timestamp}
+            resources.append(observation)
+
+        result = ObservationFlattener().flatten(resources)
+
+        self.assertFalse(result.df[ColumnNames.EFFECTIVE_DATE_TIME.value].isna().any())
+
+    def test_to_utc_dates(self):
+        """
+        Ensures that effective date times are converted to their UTC date, whether they are
+        timezone-aware, naive, missing, or ISO 8601 strings.
+        """
+        pacific = timezone(timedelta(hours=-7))
+        values = [
+            datetime(2024, 1, 1, 20, tzinfo=pacific),
+            datetime(2024, 1, 1, 3),
+            None,
+        ]
+
+        self.assertEqual(
+            to_utc_dates(values).tolist()[:2], [date(2024, 1, 2), date(2024, 1, 1)]
+        )
+        self.assertTrue(pd.isna(to_utc_dates(values).iloc[2]))
+        self.assertEqual(
+            to_utc_dates(values[:1] + ["2024-01-02T03:04:05.1Z"]).tolist(),
+            [date(2024, 1, 2), date(2024, 1, 2)],
+        )
+
+    def test_to_utc_dates_parses_iso_strings(self):
+        """
+        Ensures that ISO 8601 strings with different precisions and UTC offsets are parsed into
+        their UTC dates instead of being coerced to `NaT`.
+        """
+        values = [
+            "2024-03-01T23:30:00-05:00",
+            "2024-03-02T10:15:00.123456Z",
+            "2024-03-03T00:30:00+02:00",
+        ]
+
+        self.assertEqual(
+            to_utc_dates(values).tolist(),
+            [date(2024, 3, 2), date(2024, 3, 2), date(2024, 3, 2)],
+        )
+
+    def test_flatten_serializes_each_observation_once(self):
+        """
+        Ensures that `ObservationFlattener` reads all fields from a single `dict()` call per
+        Observation, and that the coding helpers accept the serialized dictionary directly.
+        """
+        resources = create_mock_observations()
+
+        if isinstance(resources, str):
+            self.fail(f"Failed to create mock observations: {resources}")
+
+        with patch.object(
+            Observation, "dict", autospec=True, side_effect=Observation.dict
+        ) as mock_dict:
+            result = ObservationFlattener().flatten(resources)
+
+        self.assertEqual(mock_dict.call_count, len(resources))
+        self.assertEqual(
+            extract_coding_info(resources[0].dict()), extract_coding_info(resources[0])
+        )
+        self.assertEqual(
+            result.df[ColumnNames.LOINC_CODE.value].iloc[0],
+            extract_coding_info(resources[0])[ColumnNames.LOINC_CODE.value],
+        )
+
 
 class TestECGObservationFlattener(unittest.TestCase):  # pylint: disable=unused-variable
     """
@@ -31,6 +31,7 @@ Constants used in the tests:
 """
 
 # Standard library imports
+from datetime import date
 from pathlib import Path
 import random
 
@@ -108,6 +109,29 @@ class TestFHIRDataProcessor(unittest.TestCase):  # pylint: disable=unused-variab
         self.assertIsNotNone(processed_df)
         self.assertIsInstance(processed_df, FHIRDataFrame)
 
+    def test_process_fhir_data_drops_rows_without_user_or_date(self):
+        """Test that rows missing a user ID or a date are left out of the processed data."""
+        self.processor.code_processor = MagicMock()
+        self.processor.code_processor.default_value_ranges = {}
+        self.processor.code_processor.code_to_function = {}
+        df = self.fhir_df.df.head(3).copy()
+        df[ColumnNames.LOINC_CODE.value] = "8302-2"
+        df[ColumnNames.QUANTITY_VALUE.value] = [170, 171, 172]
+        df[ColumnNames.USER_ID.value] = ["user1", None, "user1"]
+        df[ColumnNames.EFFECTIVE_DATE_TIME.value] = [
+            date(2023, 1, 1),
+            date(2023, 1, 2),
+            pd.NaT,
+        ]
+
+        processed_df = self.processor.process_fhir_data(
+            FHIRDataFrame(df, FHIRResourceType.OBSERVATION)
+        )
+
+        self.assertEqual(
+            processed_df.df[ColumnNames.QUANTITY_VALUE.value].tolist(), [170]
+        )
+
     def test_filter_outliers(self):
         """Test outlier filtering based on specific value ranges."""
         filtered_df = self.processor.filter_outliers(
@@ -127,6 +151,26 @@ class TestFHIRDataProcessor(unittest.TestCase):  # pylint: disable=unused-variab
         if OUTLIER_VALUE in self.fhir_df.df[ColumnNames.QUANTITY_VALUE.value].values:
             self.assertLess(len(filtered_df.df), len(self.fhir_df.df))
 
+    def test_filter_outliers_by_loinc_code_ranges(self):
+        """Test outlier filtering with the default value range of each row's LOINC code."""
+        self.processor.code_processor = MagicMock()
+        self.processor.code_processor.default_value_ranges = {
+            "55423-8": (LOWER_THRESHOLD, UPPER_THRESOLD),
+            "8302-2": (),
+        }
+        df = self.fhir_df.df.head(3).copy()
+        df[ColumnNames.LOINC_CODE.value] = ["55423-8", "55423-8", "8302-2"]
+        df[ColumnNames.QUANTITY_VALUE.value] = [10, OUTLIER_VALUE, OUTLIER_VALUE]
+
+        filtered_df = self.processor.filter_outliers(
+            FHIRDataFrame(df, FHIRResourceType.OBSERVATION)
+        )
+
+        self.assertEqual(
+            filtered_df.df[ColumnNames.QUANTITY_VALUE.value].tolist(),
+            [10, OUTLIER_VALUE],
+        )
+
     def test_select_data_by_user(self):
         """Verify the user ID filtering functionality."""
         print("DataFrame before filtering by user:", self.fhir_df.df)
@@ -164,6 +208,20 @@ class TestFHIRDataProcessor(unittest.TestCase):  # pylint: disable=unused-variab
             f"The number of rows after filtering should be exactly {expected_number_of_rows}.",
         )
 
+    def test_select_data_by_single_date(self):
+        """Verify that equal start and end dates select exactly that day."""
+        day = self.fhir_df.df[ColumnNames.EFFECTIVE_DATE_TIME.value].iloc[0]
+        expected_number_of_rows = (
+            self.fhir_df.df[ColumnNames.EFFECTIVE_DATE_TIME.value] == day
+        ).sum()
+
+        selected_data = select_data_by_dates(self.fhir_df, str(day), str(day))
+
+        self.assertEqual(len(selected_data.df), expected_number_of_rows)
+        self.assertTrue(
+            (selected_data.df[ColumnNames.EFFECTIVE_DATE_TIME.value] == day).all()
+        )
+
 
 class TestCalculateRiskScore(unittest.TestCase):  # pylint: disable=unused-variable
     """
@@ -264,6 +322,54 @@ class TestCalculateRiskScore(unittest.TestCase):  # pylint: disable=unused-varia
             result_df.df["ScoreInterpretation"].iloc[0], expected_interpretation
         )
 
+    def test_calculate_phq9_score_mixed_timestamp_formats(self):
+        """Authored dates with different UTC offsets and precisions are all parsed."""
+        self.fhir_df_phq_gad.df[ColumnNames.AUTHORED_DATE.value] = [
+            "2023-01-01T10:00:00+01:00",
+            "2023-01-01T10:00:00+01:00",
+            "2023-01-02T08:00:00.250-05:00",
+            "2023-01-02T08:00:00.250-05:00",
+        ]
+        result_df = calculate_risk_score(
+            self.fhir_df_phq_gad, SupportedQuestionnaires.PHQ_9.value
+        )
+
+        self.assertEqual(
+            result_df.df[ColumnNames.AUTHORED_DATE.value].tolist(),
+            [
+                pd.Timestamp("2023-01-01T09:00:00Z"),
+                pd.Timestamp("2023-01-02T13:00:00.250Z"),
+            ],
+        )
+        self.assertEqual(result_df.df["RiskScore"].tolist(), [5, 5])
+
+    def test_calculate_phq9_score_keeps_shared_offset(self):
+        """Authored dates that share one UTC offset keep their local time."""
+        self.fhir_df_phq_gad.df[ColumnNames.AUTHORED_DATE.value] = [
+            "2023-01-01T23:30:00-05:00",
+            "2023-01-01T23:30:00-05:00",
+            "2023-01-02T08:00:00.250-05:00",
+            "2023-01-02T08:00:00.250-05:00",
+        ]
+        result_df = calculate_risk_score(
+            self.fhir_df_phq_gad, SupportedQuestionnaires.PHQ_9.value
+        )
+
+        self.assertEqual(
+            result_df.df[ColumnNames.AUTHORED_DATE.value].tolist(),
+            [
+                pd.Timestamp("2023-01-01T23:30:00-05:00"),
+                pd.Timestamp("2023-01-02T08:00:00.250-05:00"),
+            ],
+        )
+        self.assertEqual(
+            [
+                authored.day
+                for authored in result_df.df[ColumnNames.AUTHORED_DATE.value]
+            ],
+            [1, 2],
+        )
+
     def test_unsupported_questionnaire(self):
         with self.assertRaises(ValueError) as context:
             calculate_risk_score(self.fhir_df_phq_gad, "Unsupported")